@@ -43,6 +43,7 @@ class CaptureQualityGate:
         self._metrics: CaptureMetrics | None = None
         self._status: QualityStatus = QualityStatus.PASS
         self._reasons: list[str] = []
+        self._reason_codes: list[str] = []
         self._suggestions: list[str] = []
 
     def validate(self, metrics: CaptureMetrics) -> QualityStatus:
@@ -56,6 +57,7 @@ class CaptureQualityGate:
         """
         self._metrics = metrics
         self._reasons = []
+        self._reason_codes = []
         self._suggestions = []
         self._status = QualityStatus.PASS
 
@@ -79,6 +81,7 @@ class CaptureQualityGate:
 
         if metrics.num_keyframes < min_frames * self.FAIL_RATIO:
             self._set_status(QualityStatus.FAIL)
+            self._reason_codes.append("low_keyframe_count")
             self._reasons.append(
                 f"Keyframe count ({metrics.num_keyframes}) is critically low "
                 f"(minimum: {min_frames})"
@@ -88,6 +91,7 @@ class CaptureQualityGate:
             )
         elif metrics.num_keyframes < min_frames * self.WARN_RATIO:
             self._set_status(QualityStatus.WARN)
+            self._reason_codes.append("keyframe_count_warn")
             self._reasons.append(
                 f"Keyframe count ({metrics.num_keyframes}) is below recommended "
                 f"(minimum: {min_frames})"
@@ -102,6 +106,7 @@ class CaptureQualityGate:
 
         if metrics.coverage_score < min_coverage * self.FAIL_RATIO:
             self._set_status(QualityStatus.FAIL)
+            self._reason_codes.append("low_coverage")
             self._reasons.append(
                 f"Coverage ({metrics.coverage_score:.1%}) is critically low "
                 f"(minimum: {min_coverage:.0%})"
@@ -111,6 +116,7 @@ class CaptureQualityGate:
             )
         elif metrics.coverage_score < min_coverage * self.WARN_RATIO:
             self._set_status(QualityStatus.WARN)
+            self._reason_codes.append("coverage_warn")
             self._reasons.append(
                 f"Coverage ({metrics.coverage_score:.1%}) is below recommended "
                 f"(minimum: {min_coverage:.0%})"
@@ -125,6 +131,7 @@ class CaptureQualityGate:
 
         if metrics.depth_valid_ratio_min < min_depth_ratio * self.FAIL_RATIO:
             self._set_status(QualityStatus.FAIL)
+            self._reason_codes.append("low_depth_valid_ratio")
             self._reasons.append(
                 f"Minimum depth valid ratio ({metrics.depth_valid_ratio_min:.1%}) is too low "
                 f"(minimum: {min_depth_ratio:.0%})"
@@ -134,6 +141,7 @@ class CaptureQualityGate:
             )
         elif metrics.depth_valid_ratio_mean < min_depth_ratio:
             self._set_status(QualityStatus.WARN)
+            self._reason_codes.append("depth_valid_ratio_warn")
             self._reasons.append(
                 f"Mean depth valid ratio ({metrics.depth_valid_ratio_mean:.1%}) is below recommended "
                 f"(minimum: {min_depth_ratio:.0%})"
@@ -146,6 +154,7 @@ class CaptureQualityGate:
         """Check if blur scores are acceptable."""
         if metrics.blur_score_min < self.MIN_BLUR_SCORE:
             self._set_status(QualityStatus.FAIL)
+            self._reason_codes.append("severe_motion_blur")
             self._reasons.append(
                 f"Minimum blur score ({metrics.blur_score_min:.2f}) indicates severe motion blur"
             )
@@ -154,6 +163,7 @@ class CaptureQualityGate:
             )
         elif metrics.blur_score_mean < self.WARN_BLUR_SCORE:
             self._set_status(QualityStatus.WARN)
+            self._reason_codes.append("blur_score_warn")
             self._reasons.append(
                 f"Mean blur score ({metrics.blur_score_mean:.2f}) indicates some motion blur"
             )
@@ -189,6 +199,17 @@ class CaptureQualityGate:
         """
         return self._suggestions.copy()
 
+    def get_reason_codes(self) -> list[str]:
+        """Get machine-readable reason codes from the last validation.
+
+        Each code corresponds, in order, to an entry in the human-readable
+        reasons, so callers can match on codes without parsing messages.
+
+        Returns:
+            List of reason code strings
+        """
+        return self._reason_codes.copy()
+
     def get_report(self) -> dict[str, object]:
         """Generate detailed validation report.
 
@@ -1,6 +1,7 @@
 """Storage layer for JSON-based data persistence."""
 
 import json
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Generic, TypeVar
@@ -65,12 +66,14 @@ class ProfileStorage(BaseStorage[Profile]):
 
     def list_all(self) -> list[Profile]:
         """List all profiles."""
+        # scandir reports the entry type without an extra stat per profile
+        with os.scandir(self.base_dir) as entries:
+            profile_ids = [entry.name for entry in entries if entry.is_dir()]
         profiles: list[Profile] = []
-        for profile_dir in self.base_dir.iterdir():
-            if profile_dir.is_dir():
-                profile = self.load(profile_dir.name, Profile)
-                if profile:
-                    profiles.append(profile)
+        for profile_id in profile_ids:
+            profile = self.load(profile_id, Profile)
+            if profile:
+                profiles.append(profile)
         return sorted(profiles, key=lambda p: p.updated_at, reverse=True)
 
     def get_profile_dir(self, profile_id: str) -> Path:
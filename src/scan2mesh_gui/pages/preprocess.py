@@ -362,34 +362,34 @@ def render_preprocess() -> None:
 
                 # Process all frames
                 with st.spinner("Processing frames..."):
-                    import time
-                    for frame in captured_frames:
-                        result = preprocess_service.process_frame(
+                    try:
+                        for _frame, result in preprocess_service.process_frames(
                             new_session,
-                            frame,
+                            captured_frames,
                             method,
                             settings,
-                        )
-                        if result:
-                            masked_frame, rgb_masked, depth_masked, mask = result
-
-                            # Save the masked frame
-                            saved_frame = preprocess_service.save_masked_frame(
-                                new_session,
-                                masked_frame,
-                                rgb_masked,
-                                depth_masked,
-                                mask,
-                            )
-
-                            # Add to session
-                            new_session = preprocess_service.add_masked_frame_to_session(
-                                new_session, saved_frame
-                            )
-                            st.session_state.preprocess_session = new_session
-
-                        # Small delay for visual feedback
-                        time.sleep(0.1)
+                        ):
+                            if result:
+                                masked_frame, bgr_masked, depth_masked, mask = result
+
+                                # Save the masked frame
+                                saved_frame = preprocess_service.save_masked_frame(
+                                    new_session,
+                                    masked_frame,
+                                    bgr_masked,
+                                    depth_masked,
+                                    mask,
+                                )
+
+                                # Add to session
+                                new_session = preprocess_service.add_masked_frame_to_session(
+                                    new_session, saved_frame
+                                )
+                                st.session_state.preprocess_session = new_session
+                    finally:
+                        # Finish background writes even if processing failed,
+                        # so their files exist and their errors surface
+                        preprocess_service.flush_writes()
 
                 # Stop the session
                 stopped_session = preprocess_service.stop_session(new_session)
@@ -1,8 +1,9 @@
 """Pipeline execution service wrapping scan2mesh Core."""
 
+import os
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from scan2mesh_gui.models.scan_object import PipelineStage, QualityStatus, ScanObject
 
@@ -10,6 +11,15 @@ from scan2mesh_gui.models.scan_object import PipelineStage, QualityStatus, ScanO
 class PipelineService:
     """Service for executing scan2mesh pipeline stages."""
 
+    # Standard directories created for every project
+    PROJECT_SUBDIRS: ClassVar[tuple[str, ...]] = (
+        "raw_frames",
+        "masked_frames",
+        "recon",
+        "asset",
+        "metrics",
+    )
+
     def __init__(self, projects_dir: Path) -> None:
         self.projects_dir = projects_dir
         self.projects_dir.mkdir(parents=True, exist_ok=True)
@@ -20,11 +30,8 @@ class PipelineService:
         project_path.mkdir(parents=True, exist_ok=True)
 
         # Create standard directories
-        (project_path / "raw_frames").mkdir(exist_ok=True)
-        (project_path / "masked_frames").mkdir(exist_ok=True)
-        (project_path / "recon").mkdir(exist_ok=True)
-        (project_path / "asset").mkdir(exist_ok=True)
-        (project_path / "metrics").mkdir(exist_ok=True)
+        for subdir in self.PROJECT_SUBDIRS:
+            (project_path / subdir).mkdir(exist_ok=True)
 
         return project_path
 
@@ -132,15 +139,23 @@ class PipelineService:
             return PipelineStage.PACKAGE
         if (project_path / "recon" / "mesh_raw.glb").exists():
             return PipelineStage.OPTIMIZE
-        if (project_path / "masked_frames").exists() and any(
-            (project_path / "masked_frames").iterdir()
-        ):
+        if self._has_entries(project_path / "masked_frames"):
             return PipelineStage.RECONSTRUCT
-        if (project_path / "raw_frames").exists() and any(
-            (project_path / "raw_frames").iterdir()
-        ):
+        if self._has_entries(project_path / "raw_frames"):
             return PipelineStage.PREPROCESS
         if (project_path / "capture_plan.json").exists():
             return PipelineStage.CAPTURE
 
         return PipelineStage.PLAN
+
+    @staticmethod
+    def _has_entries(directory: Path) -> bool:
+        """Check whether a directory exists and contains at least one entry.
+
+        Stops after the first entry instead of listing the whole directory.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return next(entries, None) is not None
+        except (FileNotFoundError, NotADirectoryError):
+            return False
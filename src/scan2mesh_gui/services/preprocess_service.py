@@ -1,6 +1,10 @@
 """Preprocess service for managing preprocessing sessions."""
 
+import math
+import os
 import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import ClassVar
@@ -27,6 +31,24 @@ class PreprocessService:
     MASK_AREA_RATIO_MAX: ClassVar[float] = 0.8
     EDGE_QUALITY_THRESHOLD: ClassVar[float] = 0.3
 
+    # Downscale factor applied to masks before contour analysis
+    EDGE_QUALITY_DOWNSCALE: ClassVar[int] = 2
+
+    # Smaller masks are traced at full resolution: on them the downscale
+    # shifts the score by up to ~0.035, above this size by under 0.01
+    EDGE_QUALITY_DOWNSCALE_MIN_PIXELS: ClassVar[int] = 10000
+
+    # Masked frames are mostly zeros, so fast DEFLATE barely affects file size
+    PNG_COMPRESSION_LEVEL: ClassVar[int] = 1
+
+    # Background writer threads, so file writes overlap with encoding
+    WRITE_WORKERS: ClassVar[int] = 2
+
+    # Structuring element for mask cleanup, shared across frames
+    _MORPH_KERNEL: ClassVar[npt.NDArray[np.uint8]] = np.asarray(
+        cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5)), dtype=np.uint8
+    )
+
     def __init__(self, projects_dir: Path) -> None:
         """Initialize the preprocess service.
 
@@ -34,6 +56,8 @@ class PreprocessService:
             projects_dir: Base directory for project data
         """
         self.projects_dir = projects_dir
+        self._write_executor: ThreadPoolExecutor | None = None
+        self._pending_writes: list[Future[int]] = []
 
     def start_session(
         self,
@@ -77,7 +101,8 @@ class PreprocessService:
             settings: Method-specific settings (e.g., min_depth, max_depth)
 
         Returns:
-            Tuple of (MaskedFrame, rgb_masked, depth_masked, mask) or None if failed
+            Tuple of (MaskedFrame, bgr_masked, depth_masked, mask) or None if failed.
+            Color images stay in OpenCV's BGR order end to end.
         """
         if settings is None:
             settings = {}
@@ -91,28 +116,19 @@ class PreprocessService:
 
         if not rgb_path.exists() or not depth_path.exists():
             # Generate mock data for testing
-            rgb: npt.NDArray[np.uint8] = np.zeros((480, 640, 3), dtype=np.uint8)
+            bgr: npt.NDArray[np.uint8] = np.zeros((480, 640, 3), dtype=np.uint8)
             depth: npt.NDArray[np.uint16] = np.zeros((480, 640), dtype=np.uint16)
         else:
-            rgb_bgr = cv2.imread(str(rgb_path), cv2.IMREAD_COLOR)
-            if rgb_bgr is not None:
-                rgb = np.asarray(cv2.cvtColor(rgb_bgr, cv2.COLOR_BGR2RGB), dtype=np.uint8)
-            else:
-                rgb = np.zeros((480, 640, 3), dtype=np.uint8)
-            depth_raw = cv2.imread(str(depth_path), cv2.IMREAD_UNCHANGED)
-            if depth_raw is not None:
-                depth = np.asarray(depth_raw, dtype=np.uint16)
-            else:
-                depth = np.zeros((480, 640), dtype=np.uint16)
+            bgr, depth = self._load_pair(rgb_path, depth_path)
 
         # Generate mask based on method
-        mask = self._generate_mask(rgb, depth, method, settings)
+        mask = self._generate_mask(bgr, depth, method, settings)
 
         # Calculate mask quality
         quality = self.calculate_mask_quality(mask)
 
         # Apply mask to images
-        rgb_masked = self._apply_mask(rgb, mask)
+        bgr_masked = self._apply_mask(bgr, mask)
         depth_masked = self._apply_depth_mask(depth, mask)
 
         # Create masked frame metadata
@@ -122,11 +138,98 @@ class PreprocessService:
             quality=quality,
         )
 
-        return masked_frame, rgb_masked, depth_masked, mask
+        return masked_frame, bgr_masked, depth_masked, mask
+
+    def process_frames(
+        self,
+        session: PreprocessSession,
+        frames: list[CapturedFrame],
+        method: MaskMethod,
+        settings: dict[str, float] | None = None,
+        max_workers: int | None = None,
+        on_progress: Callable[[float], None] | None = None,
+    ) -> Iterator[
+        tuple[
+            CapturedFrame,
+            tuple[MaskedFrame, npt.NDArray[np.uint8], npt.NDArray[np.uint16], npt.NDArray[np.uint8]] | None,
+        ]
+    ]:
+        """Process multiple frames concurrently.
+
+        Frame IO and OpenCV calls release the GIL, so a thread pool is
+        enough to spread the work across cores. Results are yielded in
+        input order, so callers can store them in frame order.
+
+        Args:
+            session: The active preprocess session
+            frames: The captured frames to process
+            method: The masking method to use
+            settings: Method-specific settings (e.g., min_depth, max_depth)
+            max_workers: Number of worker threads (defaults to CPU count)
+            on_progress: Optional callback receiving progress (0.0-1.0)
+
+        Yields:
+            Tuple of (CapturedFrame, process_frame result) per frame
+        """
+        total = len(frames)
+        if total == 0:
+            return
+
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.process_frame, session, frame, method, settings)
+                for frame in frames
+            ]
+            for completed, (frame, future) in enumerate(
+                zip(frames, futures, strict=True), start=1
+            ):
+                result = future.result()
+                if on_progress:
+                    on_progress(completed / total)
+                yield frame, result
+
+    def _load_pair(
+        self,
+        rgb_path: Path,
+        depth_path: Path,
+    ) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint16]]:
+        """Load an RGB/depth image pair from disk.
+
+        File bytes are read up front and decoded from memory, so when frames
+        are processed in a thread pool the disk reads of one frame overlap
+        with the decoding of another.
+
+        Args:
+            rgb_path: Path to the RGB image file
+            depth_path: Path to the 16-bit depth image file
+
+        Returns:
+            Tuple of (bgr, depth); unreadable images are replaced with zeros
+        """
+        rgb_buf = np.frombuffer(rgb_path.read_bytes(), dtype=np.uint8)
+        depth_buf = np.frombuffer(depth_path.read_bytes(), dtype=np.uint8)
+
+        # imdecode asserts on empty input, whereas imread returned None
+        bgr_raw = cv2.imdecode(rgb_buf, cv2.IMREAD_COLOR) if rgb_buf.size else None
+        if bgr_raw is not None:
+            bgr = np.asarray(bgr_raw, dtype=np.uint8)
+        else:
+            bgr = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        depth_raw = (
+            cv2.imdecode(depth_buf, cv2.IMREAD_UNCHANGED) if depth_buf.size else None
+        )
+        if depth_raw is not None:
+            depth = np.asarray(depth_raw, dtype=np.uint16)
+        else:
+            depth = np.zeros((480, 640), dtype=np.uint16)
+
+        return bgr, depth
 
     def _generate_mask(
         self,
-        rgb: npt.NDArray[np.uint8],  # noqa: ARG002 - Used for GrabCut/U2Net methods
+        bgr: npt.NDArray[np.uint8],  # noqa: ARG002 - Used for GrabCut/U2Net methods
         depth: npt.NDArray[np.uint16],
         method: MaskMethod,
         settings: dict[str, float],
@@ -134,7 +237,7 @@ class PreprocessService:
         """Generate mask using specified method.
 
         Args:
-            rgb: RGB image array
+            bgr: Color image array (BGR)
             depth: Depth image array (uint16 in mm)
             method: The masking method
             settings: Method-specific settings
@@ -142,10 +245,11 @@ class PreprocessService:
         Returns:
             Binary mask (0 = background, 255 = foreground)
         """
-        if method == MaskMethod.DEPTH_THRESHOLD:
-            return self._generate_depth_threshold_mask(depth, settings)
-        # For other methods, return a simple mask based on depth
-        return self._generate_depth_threshold_mask(depth, settings)
+        # Methods without a dedicated generator fall back to depth threshold
+        generator = self._MASK_GENERATORS.get(
+            method, PreprocessService._generate_depth_threshold_mask
+        )
+        return generator(self, depth, settings)
 
     def _generate_depth_threshold_mask(
         self,
@@ -164,18 +268,32 @@ class PreprocessService:
         min_depth = settings.get("min_depth", 300)
         max_depth = settings.get("max_depth", 1500)
 
-        # Create mask for valid depth range
-        mask: npt.NDArray[np.uint8] = (
-            ((depth >= min_depth) & (depth <= max_depth)).astype(np.uint8) * 255
+        # Create mask for valid depth range in a single pass. Depth is integral,
+        # so rounding the bounds inward keeps the inclusive comparison exact.
+        mask: npt.NDArray[np.uint8] = np.asarray(
+            cv2.inRange(depth, math.ceil(min_depth), math.floor(max_depth)),
+            dtype=np.uint8,
         )
 
-        # Apply morphological operations to clean up mask
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        mask = np.asarray(cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel), dtype=np.uint8)
-        mask = np.asarray(cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel), dtype=np.uint8)
+        # Apply morphological operations in place to clean up mask
+        cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._MORPH_KERNEL, dst=mask)
+        cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._MORPH_KERNEL, dst=mask)
 
         return mask
 
+    # Mask generator per method, built once at class definition
+    _MASK_GENERATORS: ClassVar[
+        dict[
+            MaskMethod,
+            Callable[
+                ["PreprocessService", npt.NDArray[np.uint16], dict[str, float]],
+                npt.NDArray[np.uint8],
+            ],
+        ]
+    ] = {
+        MaskMethod.DEPTH_THRESHOLD: _generate_depth_threshold_mask,
+    }
+
     def calculate_mask_quality(
         self,
         mask: npt.NDArray[np.uint8],
@@ -189,12 +307,12 @@ class PreprocessService:
             MaskQuality with calculated metrics
         """
         # Calculate mask area ratio
-        total_pixels = mask.size
-        mask_pixels = np.sum(mask > 0)
-        mask_area_ratio = float(mask_pixels) / total_pixels
+        total_pixels = mask.shape[0] * mask.shape[1]
+        mask_pixels = cv2.countNonZero(mask)
+        mask_area_ratio = mask_pixels / total_pixels
 
         # Calculate edge quality using Laplacian
-        edge_quality = self._calculate_edge_quality(mask)
+        edge_quality = self._calculate_edge_quality(mask, mask_pixels)
 
         # Determine if mask is valid
         is_valid = (
@@ -208,15 +326,38 @@ class PreprocessService:
             is_valid=is_valid,
         )
 
-    def _calculate_edge_quality(self, mask: npt.NDArray[np.uint8]) -> float:
+    def _calculate_edge_quality(
+        self,
+        mask: npt.NDArray[np.uint8],
+        mask_pixels: int | None = None,
+    ) -> float:
         """Calculate edge quality score.
 
         Args:
             mask: Binary mask array
+            mask_pixels: Precomputed number of foreground pixels, if known
 
         Returns:
             Edge quality score (0.0-1.0, higher is better)
         """
+        if mask_pixels is None:
+            mask_pixels = cv2.countNonZero(mask)
+
+        # A contour can never enclose more area than its foreground pixels,
+        # so skip contour tracing for masks that are too small anyway
+        if mask_pixels < 100:
+            return 0.0
+
+        # Circularity and smoothness are scale-invariant, so contours of large
+        # masks are traced on a downscaled copy
+        if mask_pixels >= self.EDGE_QUALITY_DOWNSCALE_MIN_PIXELS:
+            scale = self.EDGE_QUALITY_DOWNSCALE
+            mask = cv2.resize(
+                mask, None, fx=1 / scale, fy=1 / scale, interpolation=cv2.INTER_NEAREST
+            )
+        else:
+            scale = 1
+
         # Find contours
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
@@ -227,7 +368,7 @@ class PreprocessService:
         largest_contour = max(contours, key=cv2.contourArea)
         area = cv2.contourArea(largest_contour)
 
-        if area < 100:  # Too small
+        if area * scale * scale < 100:  # Too small
             return 0.0
 
         # Calculate perimeter and circularity
@@ -248,20 +389,19 @@ class PreprocessService:
 
     def _apply_mask(
         self,
-        rgb: npt.NDArray[np.uint8],
+        bgr: npt.NDArray[np.uint8],
         mask: npt.NDArray[np.uint8],
     ) -> npt.NDArray[np.uint8]:
-        """Apply mask to RGB image.
+        """Apply mask to color image.
 
         Args:
-            rgb: RGB image array
+            bgr: Color image array (BGR)
             mask: Binary mask array
 
         Returns:
-            Masked RGB image
+            Masked color image (BGR)
         """
-        mask_3ch = np.stack([mask] * 3, axis=-1)
-        return np.where(mask_3ch > 0, rgb, 0).astype(np.uint8)
+        return np.asarray(cv2.bitwise_and(bgr, bgr, mask=mask), dtype=np.uint8)
 
     def _apply_depth_mask(
         self,
@@ -277,22 +417,25 @@ class PreprocessService:
         Returns:
             Masked depth image
         """
-        return np.where(mask > 0, depth, 0).astype(np.uint16)
+        return np.asarray(cv2.bitwise_and(depth, depth, mask=mask), dtype=np.uint16)
 
     def save_masked_frame(
         self,
         session: PreprocessSession,
         masked_frame: MaskedFrame,
-        rgb_masked: npt.NDArray[np.uint8],
+        bgr_masked: npt.NDArray[np.uint8],
         depth_masked: npt.NDArray[np.uint16],
         mask: npt.NDArray[np.uint8],
     ) -> MaskedFrame:
         """Save masked frame data to disk.
 
+        Files are written in the background; they are guaranteed to be on
+        disk after flush_writes() or stop_session() returns.
+
         Args:
             session: The active preprocess session
             masked_frame: Masked frame metadata to update
-            rgb_masked: Masked RGB image array
+            bgr_masked: Masked color image array (BGR)
             depth_masked: Masked depth image array
             mask: Binary mask array
 
@@ -313,26 +456,74 @@ class PreprocessService:
         depth_path = masked_frames_dir / depth_filename
         mask_path = masked_frames_dir / mask_filename
 
-        # Save RGB as PNG (convert to BGR for OpenCV)
-        bgr_masked = cv2.cvtColor(rgb_masked, cv2.COLOR_RGB2BGR)
-        cv2.imwrite(str(rgb_path), bgr_masked)
+        # Encode color (already BGR), 16-bit depth and 8-bit mask as PNG,
+        # then hand the file writes to the background writer
+        self._write_png(rgb_path, bgr_masked)
+        self._write_png(depth_path, depth_masked)
+
+        # Masks are strictly 0/255, so store them as 1-bit PNG; OpenCV
+        # expands them back to 0/255 on read
+        self._write_png(mask_path, mask, bilevel=True)
+
+        # Copy the already-validated frame with paths instead of rebuilding it
+        return masked_frame.model_copy(
+            update={
+                "mask_path": str(mask_path),
+                "rgb_masked_path": str(rgb_path),
+                "depth_masked_path": str(depth_path),
+            }
+        )
 
-        # Save depth as 16-bit PNG
-        cv2.imwrite(str(depth_path), depth_masked)
+    def _write_png(
+        self,
+        path: Path,
+        image: npt.NDArray[np.uint8] | npt.NDArray[np.uint16],
+        bilevel: bool = False,
+    ) -> None:
+        """Encode an image as PNG and write it to disk in the background.
 
-        # Save mask as 8-bit PNG
-        cv2.imwrite(str(mask_path), mask)
+        The writer threads are started on the first write and shut down by
+        flush_writes().
+
+        Args:
+            path: Destination file path
+            image: Image array to encode
+            bilevel: Encode as 1-bit PNG (for binary 0/255 masks)
 
-        # Create updated masked frame with paths
-        return MaskedFrame(
-            frame_id=masked_frame.frame_id,
-            method=masked_frame.method,
-            quality=masked_frame.quality,
-            mask_path=str(mask_path),
-            rgb_masked_path=str(rgb_path),
-            depth_masked_path=str(depth_path),
+        Raises:
+            ValueError: If the image cannot be encoded as PNG
+        """
+        params = [cv2.IMWRITE_PNG_COMPRESSION, self.PNG_COMPRESSION_LEVEL]
+        if bilevel:
+            params += [cv2.IMWRITE_PNG_BILEVEL, 1]
+        ok, buf = cv2.imencode(".png", image, params)
+        if not ok:
+            raise ValueError(f"Failed to encode {path.name} as PNG")
+
+        if self._write_executor is None:
+            self._write_executor = ThreadPoolExecutor(max_workers=self.WRITE_WORKERS)
+        self._pending_writes.append(
+            self._write_executor.submit(path.write_bytes, buf.tobytes())
         )
 
+    def flush_writes(self) -> None:
+        """Wait for all background frame writes to finish.
+
+        The writer threads are shut down afterwards; a later write starts
+        new ones.
+
+        Raises:
+            OSError: If any of the pending writes failed
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        executor, self._write_executor = self._write_executor, None
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
     def update_metrics(
         self,
         session: PreprocessSession,
@@ -350,21 +541,52 @@ class PreprocessService:
         if not masked_frames:
             return PreprocessMetrics()
 
-        # Calculate mean values
-        area_ratios = [f.quality.mask_area_ratio for f in masked_frames]
-        edge_qualities = [f.quality.edge_quality for f in masked_frames]
-        num_valid = sum(1 for f in masked_frames if f.quality.is_valid)
-
-        mask_area_ratio_mean = sum(area_ratios) / len(area_ratios)
-        edge_quality_mean = sum(edge_qualities) / len(edge_qualities)
+        # Accumulate all sums in a single pass
+        area_sum = 0.0
+        edge_sum = 0.0
+        num_valid = 0
+        for f in masked_frames:
+            area_sum += f.quality.mask_area_ratio
+            edge_sum += f.quality.edge_quality
+            num_valid += f.quality.is_valid
 
+        num_processed = len(masked_frames)
         return PreprocessMetrics(
-            mask_area_ratio_mean=mask_area_ratio_mean,
-            edge_quality_mean=edge_quality_mean,
-            num_processed=len(masked_frames),
+            mask_area_ratio_mean=min(1.0, area_sum / num_processed),
+            edge_quality_mean=min(1.0, edge_sum / num_processed),
+            num_processed=num_processed,
             num_valid=num_valid,
         )
 
+    def _accumulate_metrics(
+        self,
+        metrics: PreprocessMetrics,
+        quality: MaskQuality,
+    ) -> PreprocessMetrics:
+        """Fold one more frame's quality into existing metrics in O(1).
+
+        Args:
+            metrics: Metrics covering the frames processed so far
+            quality: Quality of the newly processed frame
+
+        Returns:
+            Updated PreprocessMetrics
+        """
+        n = metrics.num_processed
+        num_processed = n + 1
+        return PreprocessMetrics(
+            mask_area_ratio_mean=min(
+                1.0,
+                (metrics.mask_area_ratio_mean * n + quality.mask_area_ratio) / num_processed,
+            ),
+            edge_quality_mean=min(
+                1.0,
+                (metrics.edge_quality_mean * n + quality.edge_quality) / num_processed,
+            ),
+            num_processed=num_processed,
+            num_valid=metrics.num_valid + quality.is_valid,
+        )
+
     def stop_session(
         self,
         session: PreprocessSession,
@@ -377,6 +599,8 @@ class PreprocessService:
         Returns:
             Updated PreprocessSession with is_running=False
         """
+        self.flush_writes()
+
         return PreprocessSession(
             session_id=session.session_id,
             object_id=session.object_id,
@@ -394,34 +618,16 @@ class PreprocessService:
     ) -> PreprocessSession:
         """Add a masked frame to the session and update metrics.
 
+        The session is updated in place so that appending frames does not
+        copy the frame list or rebuild the session on every call.
+
         Args:
             session: The preprocess session
             masked_frame: The masked frame to add
 
         Returns:
-            Updated PreprocessSession with new frame and metrics
+            The same PreprocessSession with the new frame and metrics
         """
-        new_masked_frames = [*session.masked_frames, masked_frame]
-
-        # Create temporary session to calculate metrics
-        temp_session = PreprocessSession(
-            session_id=session.session_id,
-            object_id=session.object_id,
-            captured_frames=session.captured_frames,
-            masked_frames=new_masked_frames,
-            metrics=session.metrics,
-            is_running=session.is_running,
-            started_at=session.started_at,
-        )
-
-        new_metrics = self.update_metrics(temp_session)
-
-        return PreprocessSession(
-            session_id=session.session_id,
-            object_id=session.object_id,
-            captured_frames=session.captured_frames,
-            masked_frames=new_masked_frames,
-            metrics=new_metrics,
-            is_running=session.is_running,
-            started_at=session.started_at,
-        )
+        session.metrics = self._accumulate_metrics(session.metrics, masked_frame.quality)
+        session.masked_frames.append(masked_frame)
+        return session
@@ -1,13 +1,19 @@
 """Profile management service."""
 
 import io
-import json
+import os
 import shutil
 import tempfile
 import uuid
 import zipfile
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import IO, Any, ClassVar
+
+from pydantic_core import from_json
 
 from scan2mesh_gui.data.storage import ProfileStorage
 from scan2mesh_gui.models.profile import Profile
@@ -17,6 +23,33 @@ from scan2mesh_gui.models.scan_object import ScanObject
 class ProfileService:
     """Service for managing profiles."""
 
+    # Worker threads used to unlink files when deleting a profile
+    DELETE_WORKERS: ClassVar[int] = 8
+
+    # Exports larger than this are spooled to disk instead of memory
+    EXPORT_SPOOL_MAX_SIZE: ClassVar[int] = 8 * 1024 * 1024
+
+    # Already-compressed formats are stored as-is; DEFLATE gains nothing on them
+    PRECOMPRESSED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
+        {".png", ".jpg", ".jpeg", ".webp", ".mp4", ".zip"}
+    )
+
+    # Chunk size used when streaming archive entries to disk
+    COPY_BUFFER_SIZE: ClassVar[int] = 1024 * 1024
+
+    # Fields carried over on import; ids, paths and timestamps are regenerated
+    PROFILE_IMPORT_FIELDS: ClassVar[tuple[str, ...]] = ("name", "description", "tags")
+    OBJECT_IMPORT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "name",
+        "display_name",
+        "class_id",
+        "tags",
+        "known_dimension_mm",
+        "dimension_type",
+        "current_stage",
+        "quality_status",
+    )
+
     def __init__(self, profiles_dir: Path) -> None:
         self.profiles_dir = profiles_dir
         self.storage = ProfileStorage(profiles_dir)
@@ -56,6 +89,10 @@ class ProfileService:
         if not profile:
             return None
 
+        # Nothing to change; keep updated_at and skip the write
+        if name is None and description is None and tags is None:
+            return profile
+
         if name is not None:
             profile.name = name
         if description is not None:
@@ -71,35 +108,97 @@ class ProfileService:
         """Delete a profile and all its objects."""
         profile_dir = self.storage.get_profile_dir(profile_id)
         if profile_dir.exists():
-            import shutil
+            # Unlink files concurrently (unlink releases the GIL), then let
+            # rmtree remove the remaining empty directories
+            files = [
+                Path(root, name)
+                for root, _, names in os.walk(profile_dir)
+                for name in names
+            ]
+            with ThreadPoolExecutor(max_workers=self.DELETE_WORKERS) as executor:
+                for _ in executor.map(Path.unlink, files):
+                    pass
             shutil.rmtree(profile_dir)
             return True
         return False
 
-    def export_profile(self, profile_id: str) -> bytes | None:
-        """Export a profile to a ZIP file in memory.
+    def export_profile(
+        self,
+        profile_id: str,
+        out: IO[bytes] | None = None,
+    ) -> bytes | None:
+        """Export a profile to a ZIP archive.
 
         Args:
             profile_id: The ID of the profile to export.
+            out: Writable binary stream to write the ZIP to. If omitted, the
+                archive is built in a spooled temporary file and returned.
 
         Returns:
-            ZIP file contents as bytes, or None if profile not found.
+            ZIP file contents as bytes when ``out`` is omitted, otherwise None.
+            None is also returned if the profile is not found.
         """
         profile_dir = self.storage.get_profile_dir(profile_id)
         if not profile_dir.exists():
             return None
 
-        # Create ZIP in memory
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            for file_path in profile_dir.rglob("*"):
-                if file_path.is_file():
-                    # Store with relative path from profile_dir
-                    arcname = file_path.relative_to(profile_dir)
-                    zf.write(file_path, arcname)
+        if out is not None:
+            self._write_profile_zip(profile_dir, out)
+            return None
+
+        # Small archives stay in memory; large ones spill to disk
+        with tempfile.SpooledTemporaryFile(max_size=self.EXPORT_SPOOL_MAX_SIZE) as spool:
+            self._write_profile_zip(profile_dir, spool)
+            spool.seek(0)
+            return spool.read()
+
+    def _write_profile_zip(self, profile_dir: Path, out: IO[bytes]) -> None:
+        """Write all files of a profile directory to a ZIP stream.
 
-        buffer.seek(0)
-        return buffer.getvalue()
+        File contents are read by a thread pool while the main thread
+        appends finished entries in order. At most a small window of files
+        is held in memory at once.
+
+        Args:
+            profile_dir: The profile directory to archive.
+            out: Writable binary stream receiving the ZIP data.
+        """
+        files = [p for p in profile_dir.rglob("*") if p.is_file()]
+        workers = os.cpu_count() or 1
+        pending: deque[tuple[Path, Future[bytes]]] = deque()
+
+        with (
+            ThreadPoolExecutor(max_workers=workers) as executor,
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf,
+        ):
+            for file_path in files:
+                pending.append((file_path, executor.submit(file_path.read_bytes)))
+                if len(pending) >= workers * 2:
+                    self._write_zip_entry(zf, profile_dir, *pending.popleft())
+            while pending:
+                self._write_zip_entry(zf, profile_dir, *pending.popleft())
+
+    def _write_zip_entry(
+        self,
+        zf: zipfile.ZipFile,
+        profile_dir: Path,
+        file_path: Path,
+        data: Future[bytes],
+    ) -> None:
+        """Append one file to a profile archive.
+
+        Args:
+            zf: The archive being written.
+            profile_dir: The profile directory (archive root).
+            file_path: The file being archived.
+            data: Future resolving to the file contents.
+        """
+        # Store with relative path from profile_dir
+        zinfo = zipfile.ZipInfo.from_file(file_path, file_path.relative_to(profile_dir))
+        if file_path.suffix.lower() in self.PRECOMPRESSED_EXTENSIONS:
+            zf.writestr(zinfo, data.result(), zipfile.ZIP_STORED)
+        else:
+            zf.writestr(zinfo, data.result(), zipfile.ZIP_DEFLATED, 1)
 
     def import_profile(self, zip_data: bytes | io.BytesIO) -> Profile:
         """Import a profile from a ZIP file.
@@ -124,112 +223,207 @@ class ProfileService:
         zip_data.seek(0)
 
         with zipfile.ZipFile(zip_data, "r") as zf:
+            # One timestamp shared by the profile and all of its objects
+            now = datetime.now()
+            infos = zf.infolist()
+            names = {info.filename for info in infos}
+
             # Check for profile.json
-            if "profile.json" not in zf.namelist():
+            if "profile.json" not in names:
                 raise ValueError("ZIP must contain profile.json")
 
             # Check for path traversal attacks
-            for name in zf.namelist():
+            for name in names:
                 if name.startswith("/") or ".." in name:
                     raise ValueError(f"Invalid path in ZIP: {name}")
 
-            # Extract to temp directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                zf.extractall(temp_path)
-
-                # Load and validate profile
-                profile_json_path = temp_path / "profile.json"
-                with profile_json_path.open(encoding="utf-8") as f:
-                    profile_data = json.load(f)
-
-                # Validate profile data
-                old_profile = Profile(**profile_data)
-
-                # Generate new IDs
-                new_profile_id = str(uuid.uuid4())
-                new_profile = Profile(
-                    id=new_profile_id,
-                    name=old_profile.name,
-                    description=old_profile.description,
-                    tags=old_profile.tags,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
+            # Pick the carried-over fields straight from the archive bytes
+            profile_fields = self._read_import_fields(
+                zf.read("profile.json"), self.PROFILE_IMPORT_FIELDS
+            )
+
+            # Group entries under objects/ by their object directory
+            object_entries: dict[str, list[zipfile.ZipInfo]] = {}
+            for info in infos:
+                parts = info.filename.split("/", 2)
+                if len(parts) == 3 and parts[0] == "objects" and parts[1]:
+                    object_entries.setdefault(parts[1], []).append(info)
+
+            # Generate all new IDs at once: one for the profile plus one per
+            # object that has an object.json
+            num_objects = sum(
+                f"objects/{old_obj_dir}/object.json" in names
+                for old_obj_dir in object_entries
+            )
+            new_ids = self._generate_ids(1 + num_objects)
+
+            # Only the new profile is validated
+            new_profile_id = next(new_ids)
+            new_profile = Profile(
+                id=new_profile_id,
+                **profile_fields,
+                created_at=now,
+                updated_at=now,
+            )
+
+            new_profile_dir = self.profiles_dir / new_profile_id
+            new_profile_dir.mkdir(parents=True)
+            try:
+                # Reference images are streamed one at a time; reads from a
+                # single ZipFile serialize on its file handle anyway
+                new_objects_dir = new_profile_dir / "objects"
+                for info, target in self._import_objects(
+                    zf,
+                    names,
+                    object_entries,
+                    new_ids,
+                    new_profile_id,
+                    new_objects_dir,
+                    now,
+                ):
+                    self._extract_zip_entry(zf, info, target)
+
+                # Save profile.json last and atomically, so the profile is
+                # only listed once everything else is in place
+                profile_path = self.storage.get_path(new_profile_id)
+                temp_path = profile_path.with_suffix(".tmp")
+                temp_path.write_text(
+                    new_profile.model_dump_json(indent=2), encoding="utf-8"
                 )
+                temp_path.rename(profile_path)
+            except Exception:
+                # Don't leave a half-imported profile behind
+                shutil.rmtree(new_profile_dir, ignore_errors=True)
+                raise
+
+            return new_profile
+
+    def _import_objects(
+        self,
+        zf: zipfile.ZipFile,
+        names: set[str],
+        object_entries: dict[str, list[zipfile.ZipInfo]],
+        new_ids: Iterator[str],
+        new_profile_id: str,
+        new_objects_dir: Path,
+        now: datetime,
+    ) -> Iterator[tuple[zipfile.ZipInfo, Path]]:
+        """Write the imported objects and list the reference files to extract.
 
-                # Create new profile directory
-                new_profile_dir = self.profiles_dir / new_profile_id
-                new_profile_dir.mkdir(parents=True, exist_ok=True)
-
-                # Save new profile.json
-                self.storage.save(new_profile, new_profile_id)
-
-                # Process objects directory if exists
-                objects_dir = temp_path / "objects"
-                if objects_dir.exists():
-                    new_objects_dir = new_profile_dir / "objects"
-                    new_objects_dir.mkdir(exist_ok=True)
-
-                    for old_obj_dir in objects_dir.iterdir():
-                        if not old_obj_dir.is_dir():
-                            continue
-
-                        object_json_path = old_obj_dir / "object.json"
-                        if not object_json_path.exists():
-                            continue
-
-                        # Load old object
-                        with object_json_path.open(encoding="utf-8") as f:
-                            obj_data = json.load(f)
-
-                        old_object = ScanObject(**obj_data)
-
-                        # Generate new object ID
-                        new_object_id = str(uuid.uuid4())
-                        new_object = ScanObject(
-                            id=new_object_id,
-                            profile_id=new_profile_id,
-                            name=old_object.name,
-                            display_name=old_object.display_name,
-                            class_id=old_object.class_id,
-                            tags=old_object.tags,
-                            known_dimension_mm=old_object.known_dimension_mm,
-                            dimension_type=old_object.dimension_type,
-                            reference_images=[],  # Will be updated below
-                            preview_image=None,
-                            current_stage=old_object.current_stage,
-                            quality_status=old_object.quality_status,
-                            project_path=None,
-                            created_at=datetime.now(),
-                            updated_at=datetime.now(),
-                        )
-
-                        # Create new object directory
-                        new_obj_dir = new_objects_dir / new_object_id
-                        new_obj_dir.mkdir(exist_ok=True)
-
-                        # Copy reference images if exist
-                        old_ref_dir = old_obj_dir / "reference"
-                        if old_ref_dir.exists():
-                            new_ref_dir = new_obj_dir / "reference"
-                            shutil.copytree(old_ref_dir, new_ref_dir)
-
-                            # Update reference image paths
-                            new_ref_images = []
-                            for img_path in new_ref_dir.iterdir():
-                                if img_path.is_file():
-                                    rel_path = f"reference/{img_path.name}"
-                                    new_ref_images.append(rel_path)
-                            new_object.reference_images = new_ref_images
-
-                        # Save new object.json
-                        new_object_json_path = new_obj_dir / "object.json"
-                        with new_object_json_path.open("w", encoding="utf-8") as f:
-                            json.dump(
-                                new_object.model_dump(mode="json"),
-                                f,
-                                indent=2,
-                                ensure_ascii=False,
-                            )
-
-                return new_profile
+        Args:
+            zf: The archive being imported.
+            names: All entry names in the archive.
+            object_entries: Archive entries grouped by old object directory.
+            new_ids: Source of new object IDs.
+            new_profile_id: ID of the newly imported profile.
+            new_objects_dir: The new profile's objects directory.
+            now: Timestamp for the new objects.
+
+        Yields:
+            (archive entry, target path) for each reference file to extract.
+        """
+        for old_obj_dir, entries in object_entries.items():
+            object_json_name = f"objects/{old_obj_dir}/object.json"
+            if object_json_name not in names:
+                continue
+
+            # Load old object fields
+            object_fields = self._read_import_fields(
+                zf.read(object_json_name), self.OBJECT_IMPORT_FIELDS
+            )
+
+            # Generate new object ID
+            new_object_id = next(new_ids)
+            new_object = ScanObject(
+                id=new_object_id,
+                profile_id=new_profile_id,
+                **object_fields,
+                reference_images=[],  # Will be updated below
+                preview_image=None,
+                project_path=None,
+                created_at=now,
+                updated_at=now,
+            )
+
+            # Create the new object directory, plus its reference
+            # directory if needed, with a single mkdir call
+            new_obj_dir = new_objects_dir / new_object_id
+            new_ref_dir = new_obj_dir / "reference"
+            ref_prefix = f"objects/{old_obj_dir}/reference/"
+            ref_entries = [e for e in entries if e.filename.startswith(ref_prefix)]
+            (new_ref_dir if ref_entries else new_obj_dir).mkdir(parents=True)
+
+            # Reference images are extracted by the caller as they are yielded
+            if ref_entries:
+
+                # Update reference image paths
+                new_ref_images = []
+                for info in ref_entries:
+                    rel_name = info.filename[len(ref_prefix) :]
+                    if not rel_name:
+                        continue
+                    target = new_ref_dir / rel_name
+                    if info.is_dir():
+                        target.mkdir(parents=True, exist_ok=True)
+                        continue
+                    if "/" in rel_name:
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                    else:
+                        new_ref_images.append(f"reference/{rel_name}")
+                    yield info, target
+                new_object.reference_images = new_ref_images
+
+            # Save new object.json (serialized by pydantic-core)
+            new_object_json_path = new_obj_dir / "object.json"
+            new_object_json_path.write_text(
+                new_object.model_dump_json(indent=2), encoding="utf-8"
+            )
+
+    def _extract_zip_entry(
+        self,
+        zf: zipfile.ZipFile,
+        info: zipfile.ZipInfo,
+        target: Path,
+    ) -> None:
+        """Stream one archive entry to a file.
+
+        Args:
+            zf: The archive opened for reading.
+            info: The entry to extract.
+            target: Destination file path.
+        """
+        with zf.open(info) as src, target.open("wb") as dst:
+            shutil.copyfileobj(src, dst, self.COPY_BUFFER_SIZE)
+
+    @staticmethod
+    def _generate_ids(count: int) -> Iterator[str]:
+        """Generate random UUID4 strings from a single os.urandom call.
+
+        Args:
+            count: Number of IDs to generate.
+
+        Yields:
+            UUID4 strings.
+        """
+        raw = os.urandom(16 * count)
+        for offset in range(0, len(raw), 16):
+            yield str(uuid.UUID(bytes=raw[offset : offset + 16], version=4))
+
+    @staticmethod
+    def _read_import_fields(raw: bytes, fields: tuple[str, ...]) -> dict[str, Any]:
+        """Parse a JSON document and keep only the given top-level fields.
+
+        Args:
+            raw: JSON document bytes.
+            fields: Names of the fields to keep.
+
+        Returns:
+            Mapping of the requested fields present in the document.
+
+        Raises:
+            ValueError: If the document is not a valid JSON object.
+        """
+        data = from_json(raw)
+        if not isinstance(data, dict):
+            raise ValueError("Expected a JSON object")
+        return {field: data[field] for field in fields if field in data}
@@ -1,10 +1,12 @@
 """Reconstruct service for managing 3D reconstruction sessions."""
 
-import random
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
 from scan2mesh_gui.models.reconstruct_session import (
     STAGE_ORDER,
     ReconstructMetrics,
@@ -13,6 +15,22 @@ from scan2mesh_gui.models.reconstruct_session import (
 )
 
 
+# Position of each stage in STAGE_ORDER
+_STAGE_INDEX: dict[ReconstructStage, int] = {
+    stage: index for index, stage in enumerate(STAGE_ORDER)
+}
+
+# Number of working stages (excludes IDLE and COMPLETE)
+_TOTAL_WORKING_STAGES = len(STAGE_ORDER) - 2
+
+# Progress ratio reported for each stage
+_STAGE_PROGRESS: dict[ReconstructStage, float] = {
+    stage: index / _TOTAL_WORKING_STAGES for stage, index in _STAGE_INDEX.items()
+}
+_STAGE_PROGRESS[ReconstructStage.IDLE] = 0.0
+_STAGE_PROGRESS[ReconstructStage.COMPLETE] = 1.0
+
+
 class ReconstructService:
     """Service for managing 3D reconstruction sessions."""
 
@@ -23,6 +41,8 @@ class ReconstructService:
             projects_dir: Base directory for project data
         """
         self.projects_dir = projects_dir
+        self._rng = np.random.default_rng()
+        self._mesh_path_cache: dict[str, str] = {}
 
     def start_session(
         self,
@@ -63,41 +83,54 @@ class ReconstructService:
         Returns:
             Updated ReconstructSession with next stage
         """
-        current_index = STAGE_ORDER.index(session.current_stage)
-
         # Check if already at final stage
         if session.current_stage == ReconstructStage.COMPLETE:
             return session
 
         # Get next stage
-        next_stage = STAGE_ORDER[current_index + 1]
-
-        # Generate metrics and output path when reaching complete
-        new_metrics = session.metrics
-        output_path = session.output_mesh_path
-        is_running = session.is_running
+        next_stage = STAGE_ORDER[_STAGE_INDEX[session.current_stage] + 1]
 
         if next_stage == ReconstructStage.COMPLETE:
-            new_metrics = self.generate_mock_metrics(session.input_frames)
-            output_path = str(
-                self.projects_dir
-                / session.object_id
-                / "recon"
-                / "mesh.ply"
-            )
-            is_running = False
+            return self._complete_session(session)
 
-        return ReconstructSession(
-            session_id=session.session_id,
-            object_id=session.object_id,
-            input_frames=session.input_frames,
-            current_stage=next_stage,
-            metrics=new_metrics,
-            is_running=is_running,
-            output_mesh_path=output_path,
-            started_at=session.started_at,
+        return session.model_copy(update={"current_stage": next_stage})
+
+    def _complete_session(
+        self,
+        session: ReconstructSession,
+    ) -> ReconstructSession:
+        """Move a session to COMPLETE with its final metrics and output path.
+
+        Args:
+            session: The reconstruction session
+
+        Returns:
+            Completed ReconstructSession
+        """
+        return session.model_copy(
+            update={
+                "current_stage": ReconstructStage.COMPLETE,
+                "metrics": self.generate_mock_metrics(session.input_frames),
+                "output_mesh_path": self._get_mesh_path(session.object_id),
+                "is_running": False,
+            }
         )
 
+    def _get_mesh_path(self, object_id: str) -> str:
+        """Get the output mesh path for an object, caching it per object.
+
+        Args:
+            object_id: ID of the object being reconstructed
+
+        Returns:
+            Path to the output mesh file
+        """
+        mesh_path = self._mesh_path_cache.get(object_id)
+        if mesh_path is None:
+            mesh_path = str(self.projects_dir / object_id / "recon" / "mesh.ply")
+            self._mesh_path_cache[object_id] = mesh_path
+        return mesh_path
+
     def get_stage_progress(self, stage: ReconstructStage) -> float:
         """Get progress ratio for a given stage.
 
@@ -107,18 +140,7 @@ class ReconstructService:
         Returns:
             Progress ratio (0.0-1.0) for the stage
         """
-        if stage == ReconstructStage.IDLE:
-            return 0.0
-        if stage == ReconstructStage.COMPLETE:
-            return 1.0
-
-        try:
-            stage_index = STAGE_ORDER.index(stage)
-            # Exclude IDLE and COMPLETE from calculation
-            total_stages = len(STAGE_ORDER) - 2  # 5 working stages
-            return stage_index / total_stages
-        except ValueError:
-            return 0.0
+        return _STAGE_PROGRESS.get(stage, 0.0)
 
     def stop_session(
         self,
@@ -132,16 +154,10 @@ class ReconstructService:
         Returns:
             Updated ReconstructSession with is_running=False
         """
-        return ReconstructSession(
-            session_id=session.session_id,
-            object_id=session.object_id,
-            input_frames=session.input_frames,
-            current_stage=session.current_stage,
-            metrics=session.metrics,
-            is_running=False,
-            output_mesh_path=session.output_mesh_path,
-            started_at=session.started_at,
-        )
+        if not session.is_running:
+            return session
+
+        return session.model_copy(update={"is_running": False})
 
     def generate_mock_metrics(self, input_frames: int) -> ReconstructMetrics:
         """Generate mock metrics based on input frame count.
@@ -152,13 +168,19 @@ class ReconstructService:
         Returns:
             ReconstructMetrics with simulated values
         """
+        rng = self._rng
+
         # Simulate vertex/triangle counts based on frame count
         base_vertices = 30000 + input_frames * 500
         vertex_variation = int(base_vertices * 0.1)
-        num_vertices = base_vertices + random.randint(-vertex_variation, vertex_variation)
+        num_vertices = base_vertices + int(
+            rng.integers(-vertex_variation, vertex_variation, endpoint=True)
+        )
 
         # Triangles are roughly 2x vertices
-        num_triangles = int(num_vertices * 1.9) + random.randint(-1000, 1000)
+        num_triangles = int(num_vertices * 1.9) + int(
+            rng.integers(-1000, 1000, endpoint=True)
+        )
 
         # Texture resolution based on quality
         texture_res = 2048 if input_frames > 30 else 1024
@@ -166,9 +188,12 @@ class ReconstructService:
         # File size estimate (roughly 100 bytes per vertex)
         file_size = num_vertices * 100 + num_triangles * 20
 
+        # Draw the coverage fluctuation and watertight roll together
+        coverage_u, watertight_u = rng.random(2)
+
         # Coverage improves with more frames
         base_coverage = min(0.95, 0.7 + input_frames * 0.007)
-        coverage = base_coverage + random.uniform(-0.05, 0.05)
+        coverage = base_coverage + (float(coverage_u) * 0.1 - 0.05)
         coverage = max(0.5, min(1.0, coverage))
 
         # Keyframes used (95% of input frames)
@@ -182,8 +207,8 @@ class ReconstructService:
             num_triangles=num_triangles,
             texture_resolution=(texture_res, texture_res),
             file_size_bytes=file_size,
-            is_watertight=random.random() > 0.2,  # 80% chance watertight
-            num_holes=random.randint(0, 3),
+            is_watertight=bool(watertight_u > 0.2),  # 80% chance watertight
+            num_holes=int(rng.integers(0, 3, endpoint=True)),
             surface_coverage=coverage,
             keyframes_used=keyframes_used,
             tracking_loss_frames=tracking_loss,
@@ -192,27 +217,34 @@ class ReconstructService:
     def run_all_stages(
         self,
         session: ReconstructSession,
+        emit_intermediate: bool = False,
+        on_stage: Callable[[ReconstructSession], None] | None = None,
     ) -> ReconstructSession:
         """Run through all reconstruction stages.
 
-        This is a convenience method that advances through all stages
-        in sequence. In a real implementation, each stage would involve
-        actual processing.
+        This is a convenience method that jumps straight to COMPLETE,
+        producing the same final session as advancing through every
+        stage in sequence. In a real implementation, each stage would
+        involve actual processing.
 
         Args:
             session: The reconstruction session
+            emit_intermediate: Advance one stage at a time instead of
+                jumping to COMPLETE
+            on_stage: Called with the session after each stage when
+                emit_intermediate is set
 
         Returns:
             Completed ReconstructSession
         """
-        current_session = session
-
-        # Start from IDLE and advance to FEATURE_EXTRACTION
-        if current_session.current_stage == ReconstructStage.IDLE:
-            current_session = self.advance_stage(current_session)
+        if session.current_stage == ReconstructStage.COMPLETE:
+            return session
 
-        # Continue advancing until complete
-        while current_session.current_stage != ReconstructStage.COMPLETE:
-            current_session = self.advance_stage(current_session)
+        if not emit_intermediate:
+            return self._complete_session(session)
 
-        return current_session
+        while session.current_stage != ReconstructStage.COMPLETE:
+            session = self.advance_stage(session)
+            if on_stage:
+                on_stage(session)
+        return session
@@ -27,9 +27,123 @@ if TYPE_CHECKING:
     from scan2mesh_gui.models.scan_object import ScanObject
 
 
+# (fail action, warn action, fail priority, warn priority) for each gate
+_GATE_ACTIONS: dict[str, tuple[str, str, ActionPriority, ActionPriority]] = {
+    "Minimum Keyframes": (
+        "Capture more frames from different angles",
+        "Consider capturing additional frames",
+        ActionPriority.HIGH,
+        ActionPriority.MEDIUM,
+    ),
+    "Depth Valid Ratio": (
+        "Improve lighting and reduce reflective surfaces",
+        "Check lighting conditions",
+        ActionPriority.HIGH,
+        ActionPriority.LOW,
+    ),
+    "Blur Score": (
+        "Slow down camera movement and ensure stable capture",
+        "Try to capture with steadier hands",
+        ActionPriority.HIGH,
+        ActionPriority.LOW,
+    ),
+    "Coverage": (
+        "Capture from more angles to improve surface coverage",
+        "Consider capturing more angles",
+        ActionPriority.HIGH,
+        ActionPriority.MEDIUM,
+    ),
+    "Mask Validity": (
+        "Improve background contrast or adjust masking parameters",
+        "Review masking settings",
+        ActionPriority.MEDIUM,
+        ActionPriority.LOW,
+    ),
+    "Mesh Watertight": (
+        "Review mesh for holes and consider manual fixes",
+        "Minor mesh issues may be acceptable",
+        ActionPriority.MEDIUM,
+        ActionPriority.LOW,
+    ),
+    "Tracking Quality": (
+        "Re-scan with slower, more deliberate movements",
+        "Consider re-scanning problematic areas",
+        ActionPriority.HIGH,
+        ActionPriority.MEDIUM,
+    ),
+    "LOD Generation": (
+        "Check mesh quality and re-run optimization",
+        "Review optimization settings",
+        ActionPriority.HIGH,
+        ActionPriority.MEDIUM,
+    ),
+}
+
+# Pipeline stage a gate's recommended action points back to
+_GATE_STAGES: dict[str, str] = {
+    "Minimum Keyframes": "Capture",
+    "Depth Valid Ratio": "Capture",
+    "Blur Score": "Capture",
+    "Coverage": "Capture",
+    "Mask Validity": "Preprocess",
+    "Mesh Watertight": "Reconstruct",
+    "Tracking Quality": "Reconstruct",
+    "LOD Generation": "Optimize",
+}
+
+# Gate reasons for each status of the three-level gates
+_DEPTH_REASONS: dict[QualityStatus, str] = {
+    QualityStatus.PASS: "Depth data quality is good",
+    QualityStatus.WARN: "Some depth data quality issues",
+    QualityStatus.FAIL: "Significant depth data quality problems",
+}
+_BLUR_REASONS: dict[QualityStatus, str] = {
+    QualityStatus.PASS: "Images are sharp",
+    QualityStatus.WARN: "Some blurry images detected",
+    QualityStatus.FAIL: "Many blurry images detected",
+}
+_COVERAGE_REASONS: dict[QualityStatus, str] = {
+    QualityStatus.PASS: "Good coverage of object surface",
+    QualityStatus.WARN: "Some areas may be under-scanned",
+    QualityStatus.FAIL: "Insufficient coverage of object surface",
+}
+_MASK_REASONS: dict[QualityStatus, str] = {
+    QualityStatus.PASS: "Most frames have valid masks",
+    QualityStatus.WARN: "Some frames have invalid masks",
+    QualityStatus.FAIL: "Many frames have invalid masks",
+}
+_TRACKING_REASONS: dict[QualityStatus, str] = {
+    QualityStatus.PASS: "Tracking was stable",
+    QualityStatus.WARN: "Some tracking issues detected",
+    QualityStatus.FAIL: "Significant tracking problems",
+}
+
+
+def _eval_threshold(
+    value: float, warn_threshold: float, fail_threshold: float
+) -> QualityStatus:
+    """Evaluate a value against warn and fail thresholds.
+
+    Args:
+        value: The metric value.
+        warn_threshold: Threshold below which status is WARN.
+        fail_threshold: Threshold below which status is FAIL.
+
+    Returns:
+        Quality status based on value.
+    """
+    if value < fail_threshold:
+        return QualityStatus.FAIL
+    elif value < warn_threshold:
+        return QualityStatus.WARN
+    return QualityStatus.PASS
+
+
 class ReportService:
     """Service for generating quality reports from pipeline sessions."""
 
+    __slots__ = ("_threshold_str", "thresholds")
+
     def __init__(self, quality_thresholds: QualityThresholds) -> None:
         """Initialize the report service.
 
@@ -38,6 +152,14 @@ class ReportService:
         """
         self.thresholds = quality_thresholds
 
+        # Threshold labels shown on the capture gates
+        self._threshold_str: dict[str, str] = {
+            "keyframes": f">= {quality_thresholds.min_keyframes}",
+            "depth": f">= {quality_thresholds.depth_valid_ratio_fail}",
+            "blur": f">= {quality_thresholds.blur_score_fail}",
+            "coverage": f">= {quality_thresholds.coverage_fail}",
+        }
+
     def extract_capture_metrics(
         self, session: "CaptureSession | None"
     ) -> CaptureMetricsSummary | None:
@@ -179,10 +301,14 @@ class ReportService:
 
         # Capture quality gates
         if capture_metrics:
+            thresholds = self.thresholds
+            threshold_str = self._threshold_str
+            evaluate = _eval_threshold
+
             # Keyframes gate
             keyframes_status = (
                 QualityStatus.PASS
-                if capture_metrics.num_keyframes >= self.thresholds.min_keyframes
+                if capture_metrics.num_keyframes >= thresholds.min_keyframes
                 else QualityStatus.FAIL
             )
             gates.append(
@@ -190,59 +316,59 @@ class ReportService:
                     gate_name="Minimum Keyframes",
                     status=keyframes_status,
                     value=capture_metrics.num_keyframes,
-                    threshold=f">= {self.thresholds.min_keyframes}",
+                    threshold=threshold_str["keyframes"],
                     reason=(
                         "Sufficient keyframes captured"
-                        if keyframes_status == QualityStatus.PASS
+                        if keyframes_status is QualityStatus.PASS
                         else "Insufficient keyframes for quality reconstruction"
                     ),
                 )
             )
 
             # Depth valid ratio gate
-            depth_status = self._evaluate_threshold(
+            depth_status = evaluate(
                 capture_metrics.depth_valid_ratio,
-                self.thresholds.depth_valid_ratio_warn,
-                self.thresholds.depth_valid_ratio_fail,
+                thresholds.depth_valid_ratio_warn,
+                thresholds.depth_valid_ratio_fail,
             )
             gates.append(
                 QualityGateResult(
                     gate_name="Depth Valid Ratio",
                     status=depth_status,
                     value=f"{capture_metrics.depth_valid_ratio:.2f}",
-                    threshold=f">= {self.thresholds.depth_valid_ratio_fail}",
+                    threshold=threshold_str["depth"],
                     reason=self._get_depth_reason(depth_status),
                 )
             )
 
             # Blur score gate
-            blur_status = self._evaluate_threshold(
+            blur_status = evaluate(
                 capture_metrics.blur_score,
-                self.thresholds.blur_score_warn,
-                self.thresholds.blur_score_fail,
+                thresholds.blur_score_warn,
+                thresholds.blur_score_fail,
             )
             gates.append(
                 QualityGateResult(
                     gate_name="Blur Score",
                     status=blur_status,
                     value=f"{capture_metrics.blur_score:.2f}",
-                    threshold=f">= {self.thresholds.blur_score_fail}",
+                    threshold=threshold_str["blur"],
                     reason=self._get_blur_reason(blur_status),
                 )
             )
 
             # Coverage gate
-            coverage_status = self._evaluate_threshold(
+            coverage_status = evaluate(
                 capture_metrics.coverage,
-                self.thresholds.coverage_warn,
-                self.thresholds.coverage_fail,
+                thresholds.coverage_warn,
+                thresholds.coverage_fail,
             )
             gates.append(
                 QualityGateResult(
                     gate_name="Coverage",
                     status=coverage_status,
                     value=f"{capture_metrics.coverage:.2f}",
-                    threshold=f">= {self.thresholds.coverage_fail}",
+                    threshold=threshold_str["coverage"],
                     reason=self._get_coverage_reason(coverage_status),
                 )
             )
@@ -268,13 +394,7 @@ class ReportService:
                     status=mask_status,
                     value=f"{mask_ratio:.2f}",
                     threshold=">= 0.9",
-                    reason=(
-                        "Most frames have valid masks"
-                        if mask_status == QualityStatus.PASS
-                        else "Some frames have invalid masks"
-                        if mask_status == QualityStatus.WARN
-                        else "Many frames have invalid masks"
-                    ),
+                    reason=_MASK_REASONS[mask_status],
                 )
             )
 
@@ -294,7 +414,7 @@ class ReportService:
                     threshold="Yes",
                     reason=(
                         "Mesh is watertight"
-                        if watertight_status == QualityStatus.PASS
+                        if watertight_status is QualityStatus.PASS
                         else "Mesh has open boundaries"
                     ),
                 )
@@ -320,13 +440,7 @@ class ReportService:
                     status=tracking_status,
                     value=f"{reconstruct_metrics.tracking_loss_frames} frames",
                     threshold="<= 5% loss",
-                    reason=(
-                        "Tracking was stable"
-                        if tracking_status == QualityStatus.PASS
-                        else "Some tracking issues detected"
-                        if tracking_status == QualityStatus.WARN
-                        else "Significant tracking problems"
-                    ),
+                    reason=_TRACKING_REASONS[tracking_status],
                 )
             )
 
@@ -350,7 +464,7 @@ class ReportService:
                     threshold="3 levels",
                     reason=(
                         "All LOD levels generated"
-                        if lod_status == QualityStatus.PASS
+                        if lod_status is QualityStatus.PASS
                         else "Some LOD levels missing"
                     ),
                 )
@@ -369,18 +483,7 @@ class ReportService:
         Returns:
             List of recommended actions.
         """
-        recommendations: list[RecommendedAction] = []
-
-        for gate in gates:
-            if gate.status == QualityStatus.FAIL:
-                action = self._get_action_for_gate(gate.gate_name, is_fail=True)
-                if action:
-                    recommendations.append(action)
-            elif gate.status == QualityStatus.WARN:
-                action = self._get_action_for_gate(gate.gate_name, is_fail=False)
-                if action:
-                    recommendations.append(action)
-
+        recommendations, _, _ = self._summarize_gates(gates)
         return recommendations
 
     def calculate_overall_status(
@@ -394,26 +497,54 @@ class ReportService:
         Returns:
             Tuple of (overall status, status message).
         """
+        _, overall_status, status_message = self._summarize_gates(gates)
+        return overall_status, status_message
+
+    def _summarize_gates(
+        self, gates: list[QualityGateResult]
+    ) -> tuple[list[RecommendedAction], QualityStatus, str]:
+        """Derive recommendations and overall status in one pass over the gates.
+
+        generate_recommendations and calculate_overall_status both delegate
+        here, and generate_report uses it directly to get both at once.
+
+        Args:
+            gates: List of quality gate results.
+
+        Returns:
+            Tuple of (recommendations, overall status, status message).
+        """
         if not gates:
-            return QualityStatus.PENDING, "Quality evaluation pending"
+            return [], QualityStatus.PENDING, "Quality evaluation pending"
 
-        has_fail = any(g.status == QualityStatus.FAIL for g in gates)
-        has_warn = any(g.status == QualityStatus.WARN for g in gates)
+        recommendations: list[RecommendedAction] = []
+        fail_count = warn_count = 0
+        for gate in gates:
+            if gate.status is QualityStatus.FAIL:
+                fail_count += 1
+                action = self._get_action_for_gate(gate.gate_name, is_fail=True)
+            elif gate.status is QualityStatus.WARN:
+                warn_count += 1
+                action = self._get_action_for_gate(gate.gate_name, is_fail=False)
+            else:
+                continue
+            if action:
+                recommendations.append(action)
 
-        if has_fail:
-            fail_count = sum(1 for g in gates if g.status == QualityStatus.FAIL)
+        if fail_count:
             return (
+                recommendations,
                 QualityStatus.FAIL,
                 f"Asset requires re-scanning ({fail_count} quality gates failed)",
             )
-        elif has_warn:
-            warn_count = sum(1 for g in gates if g.status == QualityStatus.WARN)
+        elif warn_count:
             return (
+                recommendations,
                 QualityStatus.WARN,
                 f"Asset has minor issues but is usable ({warn_count} warnings)",
             )
         else:
-            return QualityStatus.PASS, "Asset is ready for distribution"
+            return recommendations, QualityStatus.PASS, "Asset is ready for distribution"
 
     def generate_report(
         self,
@@ -444,22 +575,17 @@ class ReportService:
         optimize_metrics = self.extract_optimize_metrics(optimize_session)
         package_metrics = self.extract_package_metrics(package_session)
 
-        # Evaluate quality gates
+        # Evaluate quality gates, then recommendations and overall status
         gates = self.evaluate_quality_gates(
             capture_metrics,
             preprocess_metrics,
             reconstruct_metrics,
             optimize_metrics,
         )
-
-        # Generate recommendations
-        recommendations = self.generate_recommendations(gates)
-
-        # Calculate overall status
-        overall_status, status_message = self.calculate_overall_status(gates)
+        recommendations, overall_status, status_message = self._summarize_gates(gates)
 
         return ReportSession(
-            session_id=str(uuid.uuid4()),
+            session_id=uuid.uuid4().hex,
             object_id=scan_object.id,
             object_name=scan_object.name,
             display_name=scan_object.display_name,
@@ -474,123 +600,30 @@ class ReportService:
             recommendations=recommendations,
         )
 
-    def _evaluate_threshold(
-        self, value: float, warn_threshold: float, fail_threshold: float
-    ) -> QualityStatus:
-        """Evaluate a value against warn and fail thresholds.
-
-        Args:
-            value: The metric value.
-            warn_threshold: Threshold below which status is WARN.
-            fail_threshold: Threshold below which status is FAIL.
-
-        Returns:
-            Quality status based on value.
-        """
-        if value < fail_threshold:
-            return QualityStatus.FAIL
-        elif value < warn_threshold:
-            return QualityStatus.WARN
-        return QualityStatus.PASS
-
     def _get_depth_reason(self, status: QualityStatus) -> str:
         """Get reason string for depth quality status."""
-        if status == QualityStatus.PASS:
-            return "Depth data quality is good"
-        elif status == QualityStatus.WARN:
-            return "Some depth data quality issues"
-        return "Significant depth data quality problems"
+        return _DEPTH_REASONS[status]
 
     def _get_blur_reason(self, status: QualityStatus) -> str:
         """Get reason string for blur quality status."""
-        if status == QualityStatus.PASS:
-            return "Images are sharp"
-        elif status == QualityStatus.WARN:
-            return "Some blurry images detected"
-        return "Many blurry images detected"
+        return _BLUR_REASONS[status]
 
     def _get_coverage_reason(self, status: QualityStatus) -> str:
         """Get reason string for coverage quality status."""
-        if status == QualityStatus.PASS:
-            return "Good coverage of object surface"
-        elif status == QualityStatus.WARN:
-            return "Some areas may be under-scanned"
-        return "Insufficient coverage of object surface"
+        return _COVERAGE_REASONS[status]
 
     def _get_action_for_gate(
         self, gate_name: str, is_fail: bool
     ) -> RecommendedAction | None:
         """Get recommended action for a specific gate failure or warning."""
-        actions: dict[str, tuple[str, str, ActionPriority, ActionPriority]] = {
-            "Minimum Keyframes": (
-                "Capture more frames from different angles",
-                "Consider capturing additional frames",
-                ActionPriority.HIGH,
-                ActionPriority.MEDIUM,
-            ),
-            "Depth Valid Ratio": (
-                "Improve lighting and reduce reflective surfaces",
-                "Check lighting conditions",
-                ActionPriority.HIGH,
-                ActionPriority.LOW,
-            ),
-            "Blur Score": (
-                "Slow down camera movement and ensure stable capture",
-                "Try to capture with steadier hands",
-                ActionPriority.HIGH,
-                ActionPriority.LOW,
-            ),
-            "Coverage": (
-                "Capture from more angles to improve surface coverage",
-                "Consider capturing more angles",
-                ActionPriority.HIGH,
-                ActionPriority.MEDIUM,
-            ),
-            "Mask Validity": (
-                "Improve background contrast or adjust masking parameters",
-                "Review masking settings",
-                ActionPriority.MEDIUM,
-                ActionPriority.LOW,
-            ),
-            "Mesh Watertight": (
-                "Review mesh for holes and consider manual fixes",
-                "Minor mesh issues may be acceptable",
-                ActionPriority.MEDIUM,
-                ActionPriority.LOW,
-            ),
-            "Tracking Quality": (
-                "Re-scan with slower, more deliberate movements",
-                "Consider re-scanning problematic areas",
-                ActionPriority.HIGH,
-                ActionPriority.MEDIUM,
-            ),
-            "LOD Generation": (
-                "Check mesh quality and re-run optimization",
-                "Review optimization settings",
-                ActionPriority.HIGH,
-                ActionPriority.MEDIUM,
-            ),
-        }
-
-        if gate_name not in actions:
+        entry = _GATE_ACTIONS.get(gate_name)
+        if entry is None:
             return None
 
-        fail_action, warn_action, fail_priority, warn_priority = actions[gate_name]
-
-        # Determine target stage
-        stage_map = {
-            "Minimum Keyframes": "Capture",
-            "Depth Valid Ratio": "Capture",
-            "Blur Score": "Capture",
-            "Coverage": "Capture",
-            "Mask Validity": "Preprocess",
-            "Mesh Watertight": "Reconstruct",
-            "Tracking Quality": "Reconstruct",
-            "LOD Generation": "Optimize",
-        }
+        fail_action, warn_action, fail_priority, warn_priority = entry
 
         return RecommendedAction(
             action=fail_action if is_fail else warn_action,
             priority=fail_priority if is_fail else warn_priority,
-            target_stage=stage_map.get(gate_name, "Unknown"),
+            target_stage=_GATE_STAGES.get(gate_name, "Unknown"),
         )
@@ -6,6 +6,18 @@ from pathlib import Path
 import pytest
 
 
+# Subdirectories of an existing project
+_PROJECT_SUBDIRS = (
+    "raw_frames",
+    "keyframes",
+    "masked_frames",
+    "recon",
+    "asset",
+    "metrics",
+    "logs",
+)
+
+
 @pytest.fixture
 def tmp_project_dir(tmp_path: Path) -> Path:
     """Create a temporary project directory.
@@ -31,20 +43,10 @@ def existing_project_dir(tmp_path: Path) -> Generator[Path, None, None]:
         Path to the existing project directory
     """
     project_dir = tmp_path / "existing_project"
-    project_dir.mkdir()
-
-    # Create subdirectories
-    subdirs = [
-        "raw_frames",
-        "keyframes",
-        "masked_frames",
-        "recon",
-        "asset",
-        "metrics",
-        "logs",
-    ]
-    for subdir in subdirs:
-        (project_dir / subdir).mkdir()
+
+    # Create subdirectories (the first one also creates project_dir)
+    for subdir in _PROJECT_SUBDIRS:
+        (project_dir / subdir).mkdir(parents=True)
 
     yield project_dir
 
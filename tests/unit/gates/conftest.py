@@ -0,0 +1,273 @@
+"""Shared fixtures for quality gate tests."""
+
+from collections.abc import Callable
+
+import pytest
+
+from scan2mesh.models import (
+    AssetMetrics,
+    CaptureMetrics,
+    CollisionMetrics,
+    LODMetrics,
+    MaskMethod,
+    PoseEstimate,
+    PreprocessMetrics,
+    ReconReport,
+)
+
+
+# Bounding box used by every asset test; pydantic copies it into a list
+_UNIT_BOX = (0.1, 0.1, 0.1)
+
+# Default gate reasons; pydantic builds a new list from it per model
+_NO_REASONS: tuple[str, ...] = ()
+
+# File size for each LOD level
+_LOD_FILE_SIZES = (1000000, 500000, 100000)
+
+
+def _create_lod(level: int, triangles: int) -> LODMetrics:
+    """Create LODMetrics for one level with the given triangle count."""
+    return LODMetrics(
+        level=level,
+        triangles=triangles,
+        vertices=triangles // 2,
+        file_size_bytes=_LOD_FILE_SIZES[level],
+    )
+
+
+# Frozen models, so the defaults are shared rather than rebuilt per call
+_DEFAULT_LODS = (_create_lod(0, 50000), _create_lod(1, 20000), _create_lod(2, 5000))
+_DEFAULT_COLLISION = CollisionMetrics(
+    method="convex_hull",
+    num_convex_parts=1,
+    total_triangles=100,
+)
+
+
+def _create_asset_metrics(
+    lod0_triangles: int | None = None,
+    lod1_triangles: int | None = None,
+    lod2_triangles: int | None = None,
+    hole_area_ratio: float = 0.0,
+    non_manifold_edges: int = 0,
+    scale_uncertainty: str = "low",
+    gate_status: str = "pending",
+    gate_reasons: list[str] | None = None,
+) -> AssetMetrics:
+    """Create AssetMetrics with specified values.
+
+    LOD levels whose triangle count is not overridden reuse the defaults.
+    """
+    lod_metrics = [
+        default if triangles is None else _create_lod(level, triangles)
+        for level, (default, triangles) in enumerate(
+            zip(
+                _DEFAULT_LODS,
+                (lod0_triangles, lod1_triangles, lod2_triangles),
+                strict=True,
+            )
+        )
+    ]
+    return AssetMetrics(
+        lod_metrics=lod_metrics,
+        collision_metrics=_DEFAULT_COLLISION,
+        aabb_size=_UNIT_BOX,
+        obb_size=_UNIT_BOX,
+        hole_area_ratio=hole_area_ratio,
+        non_manifold_edges=non_manifold_edges,
+        texture_resolution=2048,
+        texture_coverage=0.0,
+        scale_uncertainty=scale_uncertainty,
+        gate_status=gate_status,
+        gate_reasons=_NO_REASONS if gate_reasons is None else gate_reasons,
+    )
+
+
+def _create_capture_metrics(
+    num_frames_raw: int = 100,
+    num_keyframes: int = 30,
+    depth_valid_ratio_mean: float = 0.9,
+    depth_valid_ratio_min: float = 0.8,
+    blur_score_mean: float = 0.7,
+    blur_score_min: float = 0.5,
+    coverage_score: float = 0.85,
+    capture_duration_sec: float = 60.0,
+) -> CaptureMetrics:
+    """Create CaptureMetrics with specified values."""
+    return CaptureMetrics(
+        num_frames_raw=num_frames_raw,
+        num_keyframes=num_keyframes,
+        depth_valid_ratio_mean=depth_valid_ratio_mean,
+        depth_valid_ratio_min=depth_valid_ratio_min,
+        blur_score_mean=blur_score_mean,
+        blur_score_min=blur_score_min,
+        coverage_score=coverage_score,
+        capture_duration_sec=capture_duration_sec,
+        gate_status="pending",
+        gate_reasons=_NO_REASONS,
+    )
+
+
+def _create_preprocess_metrics(
+    num_input_frames: int = 30,
+    num_output_frames: int = 28,
+    mask_method: MaskMethod = MaskMethod.DEPTH_THRESHOLD,
+    mask_area_ratio_mean: float = 0.4,
+    mask_area_ratio_min: float = 0.2,
+    valid_frames_ratio: float = 0.9,
+    gate_status: str = "pending",
+    gate_reasons: list[str] | None = None,
+) -> PreprocessMetrics:
+    """Create PreprocessMetrics with specified values."""
+    return PreprocessMetrics(
+        num_input_frames=num_input_frames,
+        num_output_frames=num_output_frames,
+        mask_method=mask_method,
+        mask_area_ratio_mean=mask_area_ratio_mean,
+        mask_area_ratio_min=mask_area_ratio_min,
+        valid_frames_ratio=valid_frames_ratio,
+        gate_status=gate_status,
+        gate_reasons=_NO_REASONS if gate_reasons is None else gate_reasons,
+    )
+
+
+# Identity transformation for the default pose
+_IDENTITY_4X4 = [
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+]
+
+# Built once; pydantic reuses model instances without revalidating them
+_DEFAULT_POSES = (
+    PoseEstimate(
+        frame_id=0,
+        transformation=_IDENTITY_4X4,
+        fitness=1.0,
+        inlier_rmse=0.0,
+    ),
+)
+
+
+def _create_recon_report(
+    num_frames_used: int = 30,
+    tracking_success_rate: float = 0.95,
+    alignment_rmse_mean: float = 0.005,
+    alignment_rmse_max: float = 0.01,
+    drift_indicator: float = 0.02,
+    mesh_vertices: int = 10000,
+    mesh_triangles: int = 20000,
+    processing_time_sec: float = 30.0,
+    gate_status: str = "pending",
+    gate_reasons: list[str] | None = None,
+) -> ReconReport:
+    """Create ReconReport with specified values.
+
+    The default pose is shared rather than rebuilt per call.
+    """
+    return ReconReport(
+        num_frames_used=num_frames_used,
+        tracking_success_rate=tracking_success_rate,
+        alignment_rmse_mean=alignment_rmse_mean,
+        alignment_rmse_max=alignment_rmse_max,
+        drift_indicator=drift_indicator,
+        poses=_DEFAULT_POSES,
+        tsdf_voxel_size=0.002,
+        mesh_vertices=mesh_vertices,
+        mesh_triangles=mesh_triangles,
+        processing_time_sec=processing_time_sec,
+        gate_status=gate_status,
+        gate_reasons=_NO_REASONS if gate_reasons is None else gate_reasons,
+    )
+
+
+@pytest.fixture(scope="session")
+def asset_metrics() -> Callable[..., AssetMetrics]:
+    """Provide a factory for AssetMetrics with overridable values.
+
+    Returns:
+        Factory accepting keyword overrides of the passing defaults
+    """
+    return _create_asset_metrics
+
+
+@pytest.fixture(scope="session")
+def capture_metrics() -> Callable[..., CaptureMetrics]:
+    """Provide a factory for CaptureMetrics with overridable values.
+
+    Returns:
+        Factory accepting keyword overrides of the passing defaults
+    """
+    return _create_capture_metrics
+
+
+@pytest.fixture(scope="session")
+def preprocess_metrics() -> Callable[..., PreprocessMetrics]:
+    """Provide a factory for PreprocessMetrics with overridable values.
+
+    Returns:
+        Factory accepting keyword overrides of the passing defaults
+    """
+    return _create_preprocess_metrics
+
+
+@pytest.fixture(scope="session")
+def recon_report() -> Callable[..., ReconReport]:
+    """Provide a factory for ReconReport with overridable values.
+
+    Returns:
+        Factory accepting keyword overrides of the passing defaults
+    """
+    return _create_recon_report
+
+
+@pytest.fixture(scope="session")
+def default_asset_metrics(
+    asset_metrics: Callable[..., AssetMetrics],
+) -> AssetMetrics:
+    """Provide AssetMetrics that pass every asset gate check.
+
+    The models are frozen, so a single instance is shared by all tests.
+
+    Returns:
+        Default AssetMetrics
+    """
+    return asset_metrics()
+
+
+@pytest.fixture(scope="session")
+def default_capture_metrics(
+    capture_metrics: Callable[..., CaptureMetrics],
+) -> CaptureMetrics:
+    """Provide CaptureMetrics that pass every capture gate check.
+
+    Returns:
+        Default CaptureMetrics
+    """
+    return capture_metrics()
+
+
+@pytest.fixture(scope="session")
+def default_preprocess_metrics(
+    preprocess_metrics: Callable[..., PreprocessMetrics],
+) -> PreprocessMetrics:
+    """Provide PreprocessMetrics that pass every preprocess gate check.
+
+    Returns:
+        Default PreprocessMetrics
+    """
+    return preprocess_metrics()
+
+
+@pytest.fixture(scope="session")
+def default_recon_report(
+    recon_report: Callable[..., ReconReport],
+) -> ReconReport:
+    """Provide a ReconReport that passes every reconstruction gate check.
+
+    Returns:
+        Default ReconReport
+    """
+    return recon_report()
@@ -1,5 +1,10 @@
 """Tests for AssetQualityGate."""
 
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
 from scan2mesh.gates.asset import (
     ASSET_MAX_HOLE_AREA_RATIO_PASS,
     ASSET_MAX_HOLE_AREA_RATIO_WARN,
@@ -12,43 +17,25 @@ from scan2mesh.gates.thresholds import (
     ASSET_MAX_POLYGONS_LOD0,
     QualityStatus,
 )
-from scan2mesh.models import AssetMetrics, CollisionMetrics, LODMetrics
-
-
-def create_metrics(
-    lod0_triangles: int = 50000,
-    lod1_triangles: int = 20000,
-    lod2_triangles: int = 5000,
-    hole_area_ratio: float = 0.0,
-    non_manifold_edges: int = 0,
-    scale_uncertainty: str = "low",
-    gate_status: str = "pending",
-    gate_reasons: list[str] | None = None,
-) -> AssetMetrics:
-    """Create AssetMetrics with specified values."""
-    lod_metrics = [
-        LODMetrics(level=0, triangles=lod0_triangles, vertices=lod0_triangles // 2, file_size_bytes=1000000),
-        LODMetrics(level=1, triangles=lod1_triangles, vertices=lod1_triangles // 2, file_size_bytes=500000),
-        LODMetrics(level=2, triangles=lod2_triangles, vertices=lod2_triangles // 2, file_size_bytes=100000),
-    ]
-    collision_metrics = CollisionMetrics(
-        method="convex_hull",
-        num_convex_parts=1,
-        total_triangles=100,
-    )
-    return AssetMetrics(
-        lod_metrics=lod_metrics,
-        collision_metrics=collision_metrics,
-        aabb_size=[0.1, 0.1, 0.1],
-        obb_size=[0.1, 0.1, 0.1],
-        hole_area_ratio=hole_area_ratio,
-        non_manifold_edges=non_manifold_edges,
-        texture_resolution=2048,
-        texture_coverage=0.0,
-        scale_uncertainty=scale_uncertainty,
-        gate_status=gate_status,
-        gate_reasons=gate_reasons or [],
-    )
+from scan2mesh.models import AssetMetrics
+
+
+# Values between the PASS and WARN limits, which should produce a WARN
+_HOLE_MIDPOINT = (ASSET_MAX_HOLE_AREA_RATIO_PASS + ASSET_MAX_HOLE_AREA_RATIO_WARN) / 2
+_NME_MIDPOINT = (
+    ASSET_MAX_NON_MANIFOLD_EDGES_PASS + ASSET_MAX_NON_MANIFOLD_EDGES_WARN
+) // 2 + 1
+
+
+@pytest.fixture(scope="class")
+def failed_gate(asset_metrics: Callable[..., AssetMetrics]) -> AssetQualityGate:
+    """Create an AssetQualityGate already validated into the FAIL state.
+
+    Class-scoped so tests that only read the results share one validate() call.
+    """
+    gate = AssetQualityGate()
+    gate.validate(asset_metrics(lod0_triangles=500))
+    return gate
 
 
 class TestAssetQualityGateInit:
@@ -64,19 +51,23 @@ class TestAssetQualityGateInit:
 class TestValidatePass:
     """Tests for validation that should PASS."""
 
-    def test_validate_good_metrics_passes(self) -> None:
+    def test_validate_good_metrics_passes(
+        self, default_asset_metrics: AssetMetrics
+    ) -> None:
         """Test that good metrics result in PASS."""
         gate = AssetQualityGate()
-        metrics = create_metrics()
+        metrics = default_asset_metrics
 
         status = gate.validate(metrics)
 
         assert status == QualityStatus.PASS
 
-    def test_validate_at_ideal_thresholds_passes(self) -> None:
+    def test_validate_at_ideal_thresholds_passes(
+        self, asset_metrics: Callable[..., AssetMetrics]
+    ) -> None:
         """Test metrics at ideal thresholds."""
         gate = AssetQualityGate()
-        metrics = create_metrics(
+        metrics = asset_metrics(
             hole_area_ratio=0.0,
             non_manifold_edges=0,
             scale_uncertainty="low",
@@ -90,83 +81,71 @@ class TestValidatePass:
 class TestValidateWarn:
     """Tests for validation that should WARN."""
 
-    def test_validate_high_scale_uncertainty_warns(self) -> None:
-        """Test that high scale uncertainty results in WARN."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(scale_uncertainty="high")
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.WARN
-        assert len(gate._reasons) > 0
-
-    def test_validate_minor_hole_area_warns(self) -> None:
-        """Test that minor hole area ratio results in WARN."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(
-            hole_area_ratio=(ASSET_MAX_HOLE_AREA_RATIO_PASS + ASSET_MAX_HOLE_AREA_RATIO_WARN) / 2
-        )
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.WARN
-
-    def test_validate_minor_non_manifold_edges_warns(self) -> None:
-        """Test that minor non-manifold edges result in WARN."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(
-            non_manifold_edges=(ASSET_MAX_NON_MANIFOLD_EDGES_PASS + ASSET_MAX_NON_MANIFOLD_EDGES_WARN) // 2 + 1
-        )
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.WARN
-
-    def test_validate_lod0_over_limit_warns(self) -> None:
-        """Test that LOD0 over polygon limit results in WARN."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"scale_uncertainty": "high"}, id="high_scale_uncertainty"),
+            pytest.param({"hole_area_ratio": _HOLE_MIDPOINT}, id="minor_hole_area"),
+            pytest.param(
+                {"non_manifold_edges": _NME_MIDPOINT}, id="minor_non_manifold_edges"
+            ),
+            pytest.param(
+                {"lod0_triangles": ASSET_MAX_POLYGONS_LOD0 + 1000},
+                id="lod0_over_limit",
+            ),
+        ],
+    )
+    def test_validate_warn(
+        self, kwargs: dict[str, Any], asset_metrics: Callable[..., AssetMetrics]
+    ) -> None:
+        """Test that each minor issue results in WARN with a reason."""
         gate = AssetQualityGate()
-        metrics = create_metrics(lod0_triangles=ASSET_MAX_POLYGONS_LOD0 + 1000)
+        metrics = asset_metrics(**kwargs)
 
         status = gate.validate(metrics)
 
         assert status == QualityStatus.WARN
+        assert gate._reasons
 
 
 class TestValidateFail:
     """Tests for validation that should FAIL."""
 
-    def test_validate_low_lod0_triangles_fails(self) -> None:
-        """Test that low LOD0 triangles results in FAIL."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(lod0_triangles=ASSET_MIN_LOD0_TRIANGLES - 1)
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.FAIL
-        assert len(gate._suggestions) > 0
-
-    def test_validate_high_hole_area_fails(self) -> None:
-        """Test that high hole area ratio results in FAIL."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(hole_area_ratio=ASSET_MAX_HOLE_AREA_RATIO_WARN + 0.01)
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.FAIL
-
-    def test_validate_high_non_manifold_edges_fails(self) -> None:
-        """Test that high non-manifold edge count results in FAIL."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(
+                {"lod0_triangles": ASSET_MIN_LOD0_TRIANGLES - 1},
+                id="low_lod0_triangles",
+            ),
+            pytest.param(
+                {"hole_area_ratio": ASSET_MAX_HOLE_AREA_RATIO_WARN + 0.01},
+                id="high_hole_area",
+            ),
+            pytest.param(
+                {"non_manifold_edges": ASSET_MAX_NON_MANIFOLD_EDGES_WARN + 1},
+                id="high_non_manifold_edges",
+            ),
+        ],
+    )
+    def test_validate_fail(
+        self, kwargs: dict[str, Any], asset_metrics: Callable[..., AssetMetrics]
+    ) -> None:
+        """Test that each severe issue results in FAIL with a suggestion."""
         gate = AssetQualityGate()
-        metrics = create_metrics(non_manifold_edges=ASSET_MAX_NON_MANIFOLD_EDGES_WARN + 1)
+        metrics = asset_metrics(**kwargs)
 
         status = gate.validate(metrics)
 
         assert status == QualityStatus.FAIL
+        assert gate._suggestions
 
-    def test_validate_multiple_issues_fails(self) -> None:
+    def test_validate_multiple_issues_fails(
+        self, asset_metrics: Callable[..., AssetMetrics]
+    ) -> None:
         """Test that multiple issues result in FAIL with all reasons."""
         gate = AssetQualityGate()
-        metrics = create_metrics(
+        metrics = asset_metrics(
             lod0_triangles=500,  # FAIL
             hole_area_ratio=0.1,  # FAIL
             non_manifold_edges=20,  # FAIL
@@ -181,82 +160,68 @@ class TestValidateFail:
 class TestGetSuggestions:
     """Tests for get_suggestions method."""
 
-    def test_get_suggestions_empty_after_pass(self) -> None:
+    def test_get_suggestions_empty_after_pass(
+        self, default_asset_metrics: AssetMetrics
+    ) -> None:
         """Test that suggestions are empty after PASS."""
         gate = AssetQualityGate()
-        metrics = create_metrics()
+        metrics = default_asset_metrics
 
         gate.validate(metrics)
         suggestions = gate.get_suggestions()
 
-        assert suggestions == []
+        assert not suggestions
 
-    def test_get_suggestions_after_fail(self) -> None:
+    def test_get_suggestions_after_fail(self, failed_gate: AssetQualityGate) -> None:
         """Test that suggestions exist after FAIL."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(lod0_triangles=500)
+        suggestions = failed_gate.get_suggestions()
 
-        gate.validate(metrics)
-        suggestions = gate.get_suggestions()
-
-        assert len(suggestions) > 0
-
-    def test_get_suggestions_returns_copy(self) -> None:
-        """Test that get_suggestions returns a copy."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(lod0_triangles=500)
-
-        gate.validate(metrics)
-        suggestions1 = gate.get_suggestions()
-        suggestions2 = gate.get_suggestions()
-
-        suggestions1.append("test")
-        assert len(suggestions1) != len(suggestions2)
+        assert suggestions
 
 
 class TestGetReasons:
     """Tests for get_reasons method."""
 
-    def test_get_reasons_empty_after_pass(self) -> None:
+    def test_get_reasons_empty_after_pass(
+        self, default_asset_metrics: AssetMetrics
+    ) -> None:
         """Test that reasons are empty after PASS."""
         gate = AssetQualityGate()
-        metrics = create_metrics()
+        metrics = default_asset_metrics
 
         gate.validate(metrics)
         reasons = gate.get_reasons()
 
-        assert reasons == []
+        assert not reasons
 
-    def test_get_reasons_after_fail(self) -> None:
+    def test_get_reasons_after_fail(self, failed_gate: AssetQualityGate) -> None:
         """Test that reasons exist after FAIL."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(lod0_triangles=500)
+        reasons = failed_gate.get_reasons()
 
-        gate.validate(metrics)
-        reasons = gate.get_reasons()
+        assert reasons
 
-        assert len(reasons) > 0
 
-    def test_get_reasons_returns_copy(self) -> None:
-        """Test that get_reasons returns a copy."""
-        gate = AssetQualityGate()
-        metrics = create_metrics(lod0_triangles=500)
+class TestGetterReturnsCopy:
+    """Tests that the list getters return copies."""
 
-        gate.validate(metrics)
-        reasons1 = gate.get_reasons()
-        reasons2 = gate.get_reasons()
+    @pytest.mark.parametrize("getter_name", ["get_suggestions", "get_reasons"])
+    def test_getter_returns_copy(self, getter_name: str) -> None:
+        """Test that each call returns a distinct list object."""
+        gate = AssetQualityGate()
+        getter = getattr(gate, getter_name)
 
-        reasons1.append("test")
-        assert len(reasons1) != len(reasons2)
+        assert getter() is not getter()
 
 
 class TestGetReport:
     """Tests for get_report method."""
 
-    def test_get_report_structure(self) -> None:
+    def test_get_report_structure(
+        self, asset_metrics: Callable[..., AssetMetrics]
+    ) -> None:
         """Test that get_report returns expected structure."""
         gate = AssetQualityGate()
-        metrics = create_metrics(scale_uncertainty="high")
+        metrics = asset_metrics(scale_uncertainty="high")
 
         gate.validate(metrics)
         report = gate.get_report()
@@ -1,33 +1,70 @@
 """Tests for CaptureQualityGate."""
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, cast
+
+import pytest
+
 from scan2mesh.gates.capture import CaptureQualityGate
 from scan2mesh.gates.thresholds import QualityStatus, QualityThresholds
 from scan2mesh.models import CaptureMetrics
 
 
-def create_metrics(
-    num_frames_raw: int = 100,
-    num_keyframes: int = 30,
-    depth_valid_ratio_mean: float = 0.9,
-    depth_valid_ratio_min: float = 0.8,
-    blur_score_mean: float = 0.7,
-    blur_score_min: float = 0.5,
-    coverage_score: float = 0.85,
-    capture_duration_sec: float = 60.0,
-) -> CaptureMetrics:
-    """Create CaptureMetrics with specified values."""
-    return CaptureMetrics(
-        num_frames_raw=num_frames_raw,
-        num_keyframes=num_keyframes,
-        depth_valid_ratio_mean=depth_valid_ratio_mean,
-        depth_valid_ratio_min=depth_valid_ratio_min,
-        blur_score_mean=blur_score_mean,
-        blur_score_min=blur_score_min,
-        coverage_score=coverage_score,
-        capture_duration_sec=capture_duration_sec,
-        gate_status="pending",
-        gate_reasons=[],
-    )
+# Shared default thresholds; gates only read them, so one instance suffices
+_SHARED_THRESHOLDS = QualityThresholds()
+
+
+@dataclass(slots=True, frozen=True)
+class FastCaptureMetrics:
+    """Lightweight stand-in for CaptureMetrics.
+
+    Defaults match the capture_metrics factory. validate() only reads
+    attributes, so status tests can skip pydantic validation.
+    """
+
+    num_frames_raw: int = 100
+    num_keyframes: int = 30
+    depth_valid_ratio_mean: float = 0.9
+    depth_valid_ratio_min: float = 0.8
+    blur_score_mean: float = 0.7
+    blur_score_min: float = 0.5
+    coverage_score: float = 0.85
+    capture_duration_sec: float = 60.0
+
+
+def fast_metrics(**overrides: Any) -> CaptureMetrics:
+    """Create a FastCaptureMetrics typed as CaptureMetrics for the gate.
+
+    Tests that inspect the report use the real model instead.
+    """
+    return cast("CaptureMetrics", FastCaptureMetrics(**overrides))
+
+
+def _gate() -> CaptureQualityGate:
+    """Create a CaptureQualityGate using the shared default thresholds."""
+    return CaptureQualityGate(thresholds=_SHARED_THRESHOLDS)
+
+
+@pytest.fixture(scope="class")
+def failed_gate(capture_metrics: Callable[..., CaptureMetrics]) -> CaptureQualityGate:
+    """Create a CaptureQualityGate already validated into the FAIL state.
+
+    Class-scoped so tests that only read the results share one validate() call.
+    """
+    gate = _gate()
+    gate.validate(capture_metrics(num_keyframes=5))
+    return gate
+
+
+@pytest.fixture(scope="module")
+def capture_gate() -> CaptureQualityGate:
+    """Create one CaptureQualityGate shared by the validate() tests.
+
+    validate() resets the status, reasons and suggestions on every call, so
+    tests that inspect only the latest result can reuse the same instance.
+    """
+    return _gate()
 
 
 class TestCaptureQualityGateInit:
@@ -49,19 +86,21 @@ class TestCaptureQualityGateInit:
 class TestValidatePass:
     """Tests for validation that should PASS."""
 
-    def test_validate_good_metrics_passes(self) -> None:
+    def test_validate_good_metrics_passes(
+        self, capture_gate: CaptureQualityGate, default_capture_metrics: CaptureMetrics
+    ) -> None:
         """Test that good metrics result in PASS."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics()
+        metrics = default_capture_metrics
 
-        status = gate.validate(metrics)
+        status = capture_gate.validate(metrics)
 
         assert status == QualityStatus.PASS
 
-    def test_validate_exactly_at_thresholds_passes(self) -> None:
+    def test_validate_exactly_at_thresholds_passes(
+        self, capture_gate: CaptureQualityGate
+    ) -> None:
         """Test metrics exactly at thresholds pass."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(
+        metrics = fast_metrics(
             num_keyframes=30,  # Exactly at minimum
             coverage_score=0.8,  # Exactly at minimum
             depth_valid_ratio_mean=0.7,  # Exactly at minimum
@@ -69,7 +108,7 @@ class TestValidatePass:
             blur_score_min=0.3,  # Exactly at fail threshold
         )
 
-        status = gate.validate(metrics)
+        status = capture_gate.validate(metrics)
 
         assert status == QualityStatus.PASS
 
@@ -77,135 +116,126 @@ class TestValidatePass:
 class TestValidateWarn:
     """Tests for validation that should WARN."""
 
-    def test_validate_low_keyframes_warns(self) -> None:
-        """Test that low keyframe count results in WARN."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(num_keyframes=20)  # Below 80% of 30
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.WARN
-        assert "Keyframe count" in gate._reasons[0]
-
-    def test_validate_low_coverage_warns(self) -> None:
-        """Test that low coverage results in WARN."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(coverage_score=0.55)  # Below 80% of 0.8
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.WARN
-        assert "Coverage" in gate._reasons[0]
-
-    def test_validate_low_depth_ratio_warns(self) -> None:
-        """Test that low depth valid ratio results in WARN."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(
-            depth_valid_ratio_mean=0.6,  # Below 0.7
-            depth_valid_ratio_min=0.5,  # Above fail threshold
-        )
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.WARN
-        assert "depth valid ratio" in gate._reasons[0]
-
-    def test_validate_low_blur_score_warns(self) -> None:
-        """Test that low mean blur score results in WARN."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(
-            blur_score_mean=0.4,  # Below 0.5
-            blur_score_min=0.35,  # Above fail threshold
-        )
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_code"),
+        [
+            # Below 80% of 30
+            pytest.param(
+                {"num_keyframes": 20},
+                "keyframe_count_warn",
+                id="low_keyframes",
+            ),
+            # Below 80% of 0.8
+            pytest.param(
+                {"coverage_score": 0.55},
+                "coverage_warn",
+                id="low_coverage",
+            ),
+            # Mean below 0.7, min above fail threshold
+            pytest.param(
+                {"depth_valid_ratio_mean": 0.6, "depth_valid_ratio_min": 0.5},
+                "depth_valid_ratio_warn",
+                id="low_depth_ratio",
+            ),
+            # Mean below 0.5, min above fail threshold
+            pytest.param(
+                {"blur_score_mean": 0.4, "blur_score_min": 0.35},
+                "blur_score_warn",
+                id="low_blur_score",
+            ),
+        ],
+    )
+    def test_validate_warn(
+        self,
+        capture_gate: CaptureQualityGate,
+        kwargs: dict[str, Any],
+        expected_code: str,
+    ) -> None:
+        """Test that each borderline metric results in WARN."""
+        metrics = fast_metrics(**kwargs)
 
-        status = gate.validate(metrics)
+        status = capture_gate.validate(metrics)
 
         assert status == QualityStatus.WARN
-        assert "blur score" in gate._reasons[0]
+        assert capture_gate.get_reason_codes() == [expected_code]
 
 
 class TestValidateFail:
     """Tests for validation that should FAIL."""
 
-    def test_validate_very_low_keyframes_fails(self) -> None:
-        """Test that very low keyframe count results in FAIL."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(num_keyframes=10)  # Below 50% of 30
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.FAIL
-        assert "critically low" in gate._reasons[0]
-
-    def test_validate_very_low_coverage_fails(self) -> None:
-        """Test that very low coverage results in FAIL."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(coverage_score=0.3)  # Below 50% of 0.8
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.FAIL
-        assert "Coverage" in gate._reasons[0]
-
-    def test_validate_very_low_depth_ratio_fails(self) -> None:
-        """Test that very low depth valid ratio results in FAIL."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(depth_valid_ratio_min=0.2)  # Below 50% of 0.7
-
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.FAIL
-        assert "depth valid ratio" in gate._reasons[0]
-
-    def test_validate_very_low_blur_score_fails(self) -> None:
-        """Test that very low blur score results in FAIL."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(blur_score_min=0.2)  # Below 0.3
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_codes"),
+        [
+            # Below 50% of 30
+            pytest.param(
+                {"num_keyframes": 10},
+                ["low_keyframe_count"],
+                id="very_low_keyframes",
+            ),
+            # Below 50% of 0.8
+            pytest.param(
+                {"coverage_score": 0.3},
+                ["low_coverage"],
+                id="very_low_coverage",
+            ),
+            # Below 50% of 0.7
+            pytest.param(
+                {"depth_valid_ratio_min": 0.2},
+                ["low_depth_valid_ratio"],
+                id="very_low_depth_ratio",
+            ),
+            # Below 0.3
+            pytest.param(
+                {"blur_score_min": 0.2},
+                ["severe_motion_blur"],
+                id="very_low_blur_score",
+            ),
+            # priority: warn+fail -> fail
+            pytest.param(
+                {"num_keyframes": 20, "blur_score_min": 0.2},
+                ["keyframe_count_warn", "severe_motion_blur"],
+                id="fail_takes_priority_over_warn",
+            ),
+        ],
+    )
+    def test_validate_fail(
+        self,
+        capture_gate: CaptureQualityGate,
+        kwargs: dict[str, Any],
+        expected_codes: list[str],
+    ) -> None:
+        """Test that each out-of-range metric results in FAIL."""
+        metrics = fast_metrics(**kwargs)
 
-        status = gate.validate(metrics)
+        status = capture_gate.validate(metrics)
 
         assert status == QualityStatus.FAIL
-        assert "blur score" in gate._reasons[0]
+        assert capture_gate.get_reason_codes() == expected_codes
 
-    def test_validate_multiple_failures(self) -> None:
+    def test_validate_multiple_failures(self, capture_gate: CaptureQualityGate) -> None:
         """Test that multiple failures are captured."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(
+        metrics = fast_metrics(
             num_keyframes=5,
             coverage_score=0.2,
             depth_valid_ratio_min=0.1,
             blur_score_min=0.1,
         )
 
-        status = gate.validate(metrics)
-
-        assert status == QualityStatus.FAIL
-        assert len(gate._reasons) >= 3  # Multiple issues
-
-
-class TestValidateStatusPriority:
-    """Tests for status priority handling."""
-
-    def test_fail_takes_priority_over_warn(self) -> None:
-        """Test that FAIL status takes priority over WARN."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(
-            num_keyframes=20,  # WARN level
-            blur_score_min=0.2,  # FAIL level
-        )
-
-        status = gate.validate(metrics)
+        status = capture_gate.validate(metrics)
 
         assert status == QualityStatus.FAIL
+        assert len(capture_gate._reasons) >= 3  # Multiple issues
 
 
 class TestEvaluate:
     """Tests for evaluate method."""
 
-    def test_evaluate_is_alias_for_validate(self) -> None:
+    def test_evaluate_is_alias_for_validate(
+        self, default_capture_metrics: CaptureMetrics
+    ) -> None:
         """Test that evaluate behaves same as validate."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics()
+        gate = _gate()
+        metrics = default_capture_metrics
 
         status1 = gate.validate(metrics)
         status2 = gate.evaluate(metrics)
@@ -216,37 +246,64 @@ class TestEvaluate:
 class TestGetSuggestions:
     """Tests for get_suggestions method."""
 
-    def test_get_suggestions_empty_after_pass(self) -> None:
+    def test_get_suggestions_empty_after_pass(
+        self, default_capture_metrics: CaptureMetrics
+    ) -> None:
         """Test that suggestions are empty after PASS."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics()
+        gate = _gate()
+        metrics = default_capture_metrics
 
         gate.validate(metrics)
         suggestions = gate.get_suggestions()
 
-        assert suggestions == []
+        assert not suggestions
 
-    def test_get_suggestions_after_warn(self) -> None:
+    def test_get_suggestions_after_warn(
+        self, capture_metrics: Callable[..., CaptureMetrics]
+    ) -> None:
         """Test that suggestions exist after WARN."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(num_keyframes=20)
+        gate = _gate()
+        metrics = capture_metrics(num_keyframes=20)
 
         gate.validate(metrics)
         suggestions = gate.get_suggestions()
 
-        assert len(suggestions) > 0
+        assert suggestions
 
     def test_get_suggestions_returns_copy(self) -> None:
         """Test that get_suggestions returns a copy."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(num_keyframes=5)
+        gate = _gate()
 
-        gate.validate(metrics)
-        suggestions1 = gate.get_suggestions()
-        suggestions2 = gate.get_suggestions()
+        assert gate.get_suggestions() is not gate.get_suggestions()
+
+
+class TestGetReasonCodes:
+    """Tests for get_reason_codes method."""
+
+    def test_get_reason_codes_empty_after_pass(
+        self, default_capture_metrics: CaptureMetrics
+    ) -> None:
+        """Test that reason codes are empty after PASS."""
+        gate = _gate()
+
+        gate.validate(default_capture_metrics)
 
-        suggestions1.append("test")
-        assert len(suggestions1) != len(suggestions2)
+        assert not gate.get_reason_codes()
+
+    def test_get_reason_codes_match_reasons(
+        self, failed_gate: CaptureQualityGate
+    ) -> None:
+        """Test that there is one reason code per reason."""
+        codes = failed_gate.get_reason_codes()
+
+        assert codes == ["low_keyframe_count"]
+        assert len(codes) == len(failed_gate._reasons)
+
+    def test_get_reason_codes_returns_copy(self) -> None:
+        """Test that get_reason_codes returns a copy."""
+        gate = _gate()
+
+        assert gate.get_reason_codes() is not gate.get_reason_codes()
 
 
 class TestGetReport:
@@ -254,15 +311,17 @@ class TestGetReport:
 
     def test_get_report_not_validated(self) -> None:
         """Test report before validation."""
-        gate = CaptureQualityGate()
+        gate = _gate()
         report = gate.get_report()
 
         assert report["status"] == "not_validated"
 
-    def test_get_report_after_validation(self) -> None:
+    def test_get_report_after_validation(
+        self, default_capture_metrics: CaptureMetrics
+    ) -> None:
         """Test report after validation."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics()
+        gate = _gate()
+        metrics = default_capture_metrics
 
         gate.validate(metrics)
         report = gate.get_report()
@@ -273,10 +332,12 @@ class TestGetReport:
         assert "reasons" in report
         assert "suggestions" in report
 
-    def test_get_report_includes_metrics(self) -> None:
+    def test_get_report_includes_metrics(
+        self, capture_metrics: Callable[..., CaptureMetrics]
+    ) -> None:
         """Test that report includes all metrics."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(
+        gate = _gate()
+        metrics = capture_metrics(
             num_frames_raw=50,
             num_keyframes=25,
         )
@@ -287,10 +348,12 @@ class TestGetReport:
         assert report["metrics"]["num_frames_raw"] == 50
         assert report["metrics"]["num_keyframes"] == 25
 
-    def test_get_report_includes_thresholds(self) -> None:
+    def test_get_report_includes_thresholds(
+        self, default_capture_metrics: CaptureMetrics
+    ) -> None:
         """Test that report includes thresholds."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics()
+        gate = _gate()
+        metrics = default_capture_metrics
 
         gate.validate(metrics)
         report = gate.get_report()
@@ -300,26 +363,26 @@ class TestGetReport:
         assert "min_depth_valid_ratio" in report["thresholds"]
         assert "min_blur_score" in report["thresholds"]
 
-    def test_get_report_includes_reasons_and_suggestions(self) -> None:
+    def test_get_report_includes_reasons_and_suggestions(
+        self, failed_gate: CaptureQualityGate
+    ) -> None:
         """Test that report includes reasons and suggestions for failures."""
-        gate = CaptureQualityGate()
-        metrics = create_metrics(num_keyframes=5)
-
-        gate.validate(metrics)
-        report = gate.get_report()
+        report = failed_gate.get_report()
 
-        assert len(report["reasons"]) > 0
-        assert len(report["suggestions"]) > 0
+        assert report["reasons"]
+        assert report["suggestions"]
 
 
 class TestCustomThresholds:
     """Tests for custom threshold handling."""
 
-    def test_custom_min_frames_affects_validation(self) -> None:
+    def test_custom_min_frames_affects_validation(
+        self, capture_metrics: Callable[..., CaptureMetrics]
+    ) -> None:
         """Test that custom min_frames threshold is used."""
         thresholds = QualityThresholds(capture_min_frames=10)
         gate = CaptureQualityGate(thresholds=thresholds)
-        metrics = create_metrics(num_keyframes=8)  # Would fail with default 30
+        metrics = capture_metrics(num_keyframes=8)  # Would fail with default 30
 
         status = gate.validate(metrics)
 
@@ -0,0 +1 @@
+"""Unit tests for scan2mesh_gui services."""
@@ -0,0 +1,311 @@
+"""Tests for scan2mesh_gui.services.preprocess_service module."""
+
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from scan2mesh_gui.models.capture_session import CapturedFrame, FrameQuality
+from scan2mesh_gui.models.preprocess_session import (
+    MaskedFrame,
+    MaskMethod,
+    MaskQuality,
+)
+from scan2mesh_gui.services.preprocess_service import PreprocessService
+
+
+def _create_frames(count: int) -> list[CapturedFrame]:
+    """Create captured frames whose image files do not exist.
+
+    process_frame substitutes blank images for missing files, so these
+    frames can be processed without any data on disk.
+    """
+    quality = FrameQuality(depth_valid_ratio=0.9, blur_score=0.8)
+    return [
+        CapturedFrame(
+            frame_id=frame_id,
+            quality=quality,
+            rgb_path=f"missing/frame_{frame_id:04d}_rgb.png",
+            depth_path=f"missing/frame_{frame_id:04d}_depth.png",
+        )
+        for frame_id in range(count)
+    ]
+
+
+def _circle_mask(radius: int) -> npt.NDArray[np.uint8]:
+    """Create a VGA-sized mask with a filled circle in the center."""
+    mask = np.zeros((480, 640), dtype=np.uint8)
+    cv2.circle(mask, (320, 240), radius, 255, -1)
+    return mask
+
+
+class _FullResolutionPreprocessService(PreprocessService):
+    """PreprocessService that always traces contours at full resolution."""
+
+    EDGE_QUALITY_DOWNSCALE = 1
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> PreprocessService:
+    """Create a PreprocessService writing into a temporary directory."""
+    return PreprocessService(tmp_path)
+
+
+class TestProcessFrames:
+    """Tests for process_frames method."""
+
+    def test_yields_in_input_order(
+        self, service: PreprocessService, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Results should follow input order even if later frames finish first."""
+        frames = _create_frames(4)
+        original = service.process_frame
+
+        def slow_early_frames(*args: object) -> object:
+            frame = args[1]
+            assert isinstance(frame, CapturedFrame)
+            # Earlier frames take longer, so completion order is reversed
+            time.sleep(0.02 * (len(frames) - frame.frame_id))
+            return original(*args)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(service, "process_frame", slow_early_frames)
+        session = service.start_session("obj", frames)
+
+        results = list(
+            service.process_frames(
+                session, frames, MaskMethod.DEPTH_THRESHOLD, max_workers=4
+            )
+        )
+
+        assert [frame.frame_id for frame, _ in results] == [0, 1, 2, 3]
+        assert [
+            result[0].frame_id for _, result in results if result is not None
+        ] == [0, 1, 2, 3]
+
+    def test_reports_progress(self, service: PreprocessService) -> None:
+        """Progress should rise monotonically up to 1.0."""
+        frames = _create_frames(3)
+        session = service.start_session("obj", frames)
+        progress: list[float] = []
+
+        list(
+            service.process_frames(
+                session,
+                frames,
+                MaskMethod.DEPTH_THRESHOLD,
+                on_progress=progress.append,
+            )
+        )
+
+        assert progress == sorted(progress)
+        assert progress[-1] == 1.0
+
+    def test_empty_frames_yields_nothing(self, service: PreprocessService) -> None:
+        """No frames should yield no results."""
+        session = service.start_session("obj", [])
+
+        assert not list(
+            service.process_frames(session, [], MaskMethod.DEPTH_THRESHOLD)
+        )
+
+
+class TestEdgeQuality:
+    """Tests for edge quality scoring."""
+
+    @pytest.mark.parametrize("radius", [8, 10, 15, 30, 40])
+    def test_small_masks_match_full_resolution(
+        self, service: PreprocessService, tmp_path: Path, radius: int
+    ) -> None:
+        """Masks below the downscale size should score exactly as at full size."""
+        mask = _circle_mask(radius)
+        full_resolution = _FullResolutionPreprocessService(tmp_path)
+
+        assert cv2.countNonZero(mask) < service.EDGE_QUALITY_DOWNSCALE_MIN_PIXELS
+        assert service._calculate_edge_quality(mask) == (
+            full_resolution._calculate_edge_quality(mask)
+        )
+
+    @pytest.mark.parametrize("radius", [60, 80, 120, 160, 200])
+    def test_large_masks_stay_close_to_full_resolution(
+        self, service: PreprocessService, tmp_path: Path, radius: int
+    ) -> None:
+        """Downscaled tracing should move the score by less than 0.01."""
+        mask = _circle_mask(radius)
+        full_resolution = _FullResolutionPreprocessService(tmp_path)
+
+        assert cv2.countNonZero(mask) >= service.EDGE_QUALITY_DOWNSCALE_MIN_PIXELS
+        assert service._calculate_edge_quality(mask) == pytest.approx(
+            full_resolution._calculate_edge_quality(mask), abs=0.01
+        )
+
+
+class TestApplyMask:
+    """Tests for applying masks to color and depth images."""
+
+    def test_matches_where_reference(self, service: PreprocessService) -> None:
+        """bitwise_and masking should equal zeroing pixels outside the mask."""
+        rng = np.random.default_rng(1)
+        mask = _circle_mask(120)
+        bgr = rng.integers(0, 256, (480, 640, 3), dtype=np.uint8)
+        depth = rng.integers(0, 65536, (480, 640), dtype=np.uint16)
+
+        bgr_masked = service._apply_mask(bgr, mask)
+        depth_masked = service._apply_depth_mask(depth, mask)
+
+        np.testing.assert_array_equal(
+            bgr_masked, np.where(mask[..., None] > 0, bgr, 0)
+        )
+        np.testing.assert_array_equal(depth_masked, np.where(mask > 0, depth, 0))
+        assert bgr_masked.dtype == np.uint8
+        assert depth_masked.dtype == np.uint16
+
+
+class TestAccumulateMetrics:
+    """Tests for incremental session metrics."""
+
+    _QUALITIES = (
+        MaskQuality(mask_area_ratio=0.2, edge_quality=0.9, is_valid=True),
+        MaskQuality(mask_area_ratio=0.01, edge_quality=0.1, is_valid=False),
+        MaskQuality(mask_area_ratio=0.45, edge_quality=0.7, is_valid=True),
+        MaskQuality(mask_area_ratio=0.9, edge_quality=0.35, is_valid=False),
+        MaskQuality(mask_area_ratio=0.33, edge_quality=0.8, is_valid=True),
+    )
+
+    def test_matches_full_recomputation(self, service: PreprocessService) -> None:
+        """Folding frames one by one should equal update_metrics over them."""
+        session = service.start_session("obj", [])
+
+        for frame_id, quality in enumerate(self._QUALITIES):
+            returned = service.add_masked_frame_to_session(
+                session,
+                MaskedFrame(
+                    frame_id=frame_id,
+                    method=MaskMethod.DEPTH_THRESHOLD,
+                    quality=quality,
+                ),
+            )
+            assert returned is session
+
+        expected = service.update_metrics(session)
+        assert session.metrics.num_processed == expected.num_processed == 5
+        assert session.metrics.num_valid == expected.num_valid == 3
+        assert session.metrics.mask_area_ratio_mean == pytest.approx(
+            expected.mask_area_ratio_mean
+        )
+        assert session.metrics.edge_quality_mean == pytest.approx(
+            expected.edge_quality_mean
+        )
+        assert [f.frame_id for f in session.masked_frames] == [0, 1, 2, 3, 4]
+
+
+class TestSaveMaskedFrame:
+    """Tests for background masked frame writes."""
+
+    @pytest.fixture
+    def masked_frame(self) -> MaskedFrame:
+        """Create masked frame metadata without file paths."""
+        return MaskedFrame(
+            frame_id=3,
+            method=MaskMethod.DEPTH_THRESHOLD,
+            quality=MaskQuality(mask_area_ratio=0.2, edge_quality=0.9),
+        )
+
+    def _save(
+        self, service: PreprocessService, masked_frame: MaskedFrame
+    ) -> MaskedFrame:
+        """Save a small masked frame for the given service."""
+        session = service.start_session("obj", [])
+        return service.save_masked_frame(
+            session,
+            masked_frame,
+            np.zeros((480, 640, 3), dtype=np.uint8),
+            np.zeros((480, 640), dtype=np.uint16),
+            _circle_mask(100),
+        )
+
+    def test_files_exist_after_flush(
+        self, service: PreprocessService, masked_frame: MaskedFrame
+    ) -> None:
+        """All three images should be on disk once writes are flushed."""
+        saved = self._save(service, masked_frame)
+
+        service.flush_writes()
+
+        for path in (saved.rgb_masked_path, saved.depth_masked_path, saved.mask_path):
+            assert path is not None
+            assert Path(path).is_file()
+
+    def test_saved_images_round_trip(
+        self, service: PreprocessService, masked_frame: MaskedFrame
+    ) -> None:
+        """Saved images should reload unchanged; the 1-bit mask as 0/255."""
+        rng = np.random.default_rng(0)
+        mask = _circle_mask(100)
+        bgr = service._apply_mask(
+            rng.integers(0, 256, (480, 640, 3), dtype=np.uint8), mask
+        )
+        depth = service._apply_depth_mask(
+            rng.integers(0, 65536, (480, 640), dtype=np.uint16), mask
+        )
+        session = service.start_session("obj", [])
+
+        saved = service.save_masked_frame(session, masked_frame, bgr, depth, mask)
+        service.flush_writes()
+
+        assert saved.mask_path is not None
+        assert saved.rgb_masked_path is not None
+        assert saved.depth_masked_path is not None
+        reloaded_mask = cv2.imread(saved.mask_path, cv2.IMREAD_UNCHANGED)
+        assert reloaded_mask.dtype == np.uint8
+        np.testing.assert_array_equal(reloaded_mask, mask)
+        np.testing.assert_array_equal(
+            cv2.imread(saved.rgb_masked_path, cv2.IMREAD_UNCHANGED), bgr
+        )
+        np.testing.assert_array_equal(
+            cv2.imread(saved.depth_masked_path, cv2.IMREAD_UNCHANGED), depth
+        )
+
+    def test_flush_shuts_down_writer(
+        self, service: PreprocessService, masked_frame: MaskedFrame
+    ) -> None:
+        """Flushing should stop the writer threads; later writes start new ones."""
+        self._save(service, masked_frame)
+        executor = service._write_executor
+        assert executor is not None
+
+        service.flush_writes()
+
+        assert service._write_executor is None
+        with pytest.raises(RuntimeError, match="shutdown"):
+            executor.submit(print)
+
+        self._save(service, masked_frame)
+        assert service._write_executor is not None
+        service.flush_writes()
+
+    def test_stop_session_flushes_writes(
+        self, service: PreprocessService, masked_frame: MaskedFrame
+    ) -> None:
+        """Stopping the session should finish writes and stop the writer."""
+        saved = self._save(service, masked_frame)
+
+        service.stop_session(service.start_session("obj", []))
+
+        assert saved.mask_path is not None
+        assert Path(saved.mask_path).is_file()
+        assert service._write_executor is None
+
+    def test_encode_failure_raises(
+        self,
+        service: PreprocessService,
+        masked_frame: MaskedFrame,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A frame whose PNG cannot be encoded should not be saved silently."""
+        monkeypatch.setattr(cv2, "imencode", lambda *_args: (False, None))
+
+        with pytest.raises(ValueError, match="Failed to encode"):
+            self._save(service, masked_frame)
@@ -0,0 +1,157 @@
+"""Tests for scan2mesh_gui.services.profile_service module."""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from scan2mesh_gui.models.profile import Profile
+from scan2mesh_gui.services.object_service import ObjectService
+from scan2mesh_gui.services.profile_service import ProfileService
+
+
+# Reference image bytes per object name; contents only need to differ
+_REFERENCE_IMAGES = {
+    "mug": (b"\x89PNG mug front", b"\x89PNG mug side"),
+    "bottle": (b"\x89PNG bottle",),
+}
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> ProfileService:
+    """Create a ProfileService over an empty profiles directory."""
+    profiles_dir = tmp_path / "profiles"
+    profiles_dir.mkdir()
+    return ProfileService(profiles_dir)
+
+
+@pytest.fixture
+def profile(service: ProfileService) -> Profile:
+    """Create a saved profile."""
+    return service.create_profile("original", tags=["a"])
+
+
+class TestListProfiles:
+    """Tests for list_profiles."""
+
+    def test_sorted_by_most_recent_update(
+        self, service: ProfileService, profile: Profile
+    ) -> None:
+        """The most recently updated profile should be listed first."""
+        second = service.create_profile("second")
+
+        service.update_profile(profile.id, name="renamed")
+
+        assert [p.id for p in service.list_profiles()] == [profile.id, second.id]
+
+    def test_skips_entries_without_profile(
+        self, service: ProfileService, profile: Profile
+    ) -> None:
+        """Stray files and directories without profile.json should be ignored."""
+        (service.profiles_dir / "notes.txt").write_text("x", encoding="utf-8")
+        (service.profiles_dir / "empty").mkdir()
+
+        assert [p.id for p in service.list_profiles()] == [profile.id]
+
+
+class TestImportProfile:
+    """Tests for export/import of profile archives."""
+
+    @staticmethod
+    def _zip(entries: dict[str, bytes]) -> bytes:
+        """Build a ZIP archive from name -> content entries."""
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            for name, data in entries.items():
+                zf.writestr(name, data)
+        return buf.getvalue()
+
+    def test_round_trip_remaps_objects_and_images(
+        self, service: ProfileService, profile: Profile, tmp_path: Path
+    ) -> None:
+        """Objects and images should be copied under new profile/object IDs."""
+        objects = ObjectService(service.profiles_dir, tmp_path / "projects")
+        old_ids = set()
+        for class_id, (name, images) in enumerate(_REFERENCE_IMAGES.items()):
+            obj = objects.create_object(profile.id, name, name.title(), class_id)
+            old_ids.add(obj.id)
+            for index, data in enumerate(images):
+                objects.add_reference_image(
+                    profile.id, obj.id, data, f"{name}_{index}.png"
+                )
+        archive = service.export_profile(profile.id)
+        assert archive is not None
+
+        imported = service.import_profile(archive)
+
+        assert imported.id != profile.id
+        assert imported.name == profile.name
+        assert imported.tags == profile.tags
+        new_objects = objects.list_objects(imported.id)
+        assert sorted(o.name for o in new_objects) == sorted(_REFERENCE_IMAGES)
+        assert not old_ids & {o.id for o in new_objects}
+        assert len({o.id for o in new_objects}) == len(new_objects)
+        for obj in new_objects:
+            assert obj.profile_id == imported.id
+            assert obj.preview_image is None
+            images = [
+                objects.get_reference_image_path(imported.id, obj.id, rel).read_bytes()
+                for rel in obj.reference_images
+            ]
+            assert sorted(images) == sorted(_REFERENCE_IMAGES[obj.name])
+
+        # The source profile is left untouched
+        assert {o.id for o in objects.list_objects(profile.id)} == old_ids
+
+    @pytest.mark.parametrize(
+        "bad_name",
+        [
+            pytest.param("../escape.txt", id="parent_dir"),
+            pytest.param("objects/../../escape.txt", id="nested_parent_dir"),
+            pytest.param("/etc/escape.txt", id="absolute"),
+        ],
+    )
+    def test_rejects_path_traversal(
+        self, service: ProfileService, bad_name: str
+    ) -> None:
+        """Archive entries escaping the profile directory should be refused."""
+        archive = self._zip(
+            {
+                "profile.json": Profile(name="evil").model_dump_json().encode(),
+                bad_name: b"payload",
+            }
+        )
+
+        with pytest.raises(ValueError, match="Invalid path in ZIP"):
+            service.import_profile(archive)
+
+        assert not any(service.profiles_dir.iterdir())
+
+    def test_rejects_archive_without_profile(self, service: ProfileService) -> None:
+        """An archive lacking profile.json should be refused."""
+        with pytest.raises(ValueError, match=r"must contain profile\.json"):
+            service.import_profile(self._zip({"objects/x/object.json": b"{}"}))
+
+    def test_failed_import_leaves_nothing_behind(
+        self,
+        service: ProfileService,
+        profile: Profile,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A failure mid-import should remove the partially built profile."""
+        objects = ObjectService(service.profiles_dir, tmp_path / "projects")
+        obj = objects.create_object(profile.id, "mug", "Mug", 0)
+        objects.add_reference_image(profile.id, obj.id, b"\x89PNG mug", "mug.png")
+        archive = service.export_profile(profile.id)
+        assert archive is not None
+
+        def failing_extract(*args: object) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(service, "_extract_zip_entry", failing_extract)
+        with pytest.raises(OSError, match="disk full"):
+            service.import_profile(archive)
+
+        assert [p.name for p in service.profiles_dir.iterdir()] == [profile.id]
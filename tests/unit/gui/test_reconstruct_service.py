@@ -0,0 +1,66 @@
+"""Tests for scan2mesh_gui.services.reconstruct_service module."""
+
+from pathlib import Path
+
+import pytest
+
+from scan2mesh_gui.models.reconstruct_session import (
+    STAGE_ORDER,
+    ReconstructSession,
+    ReconstructStage,
+)
+from scan2mesh_gui.services.reconstruct_service import ReconstructService
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> ReconstructService:
+    """Create a ReconstructService over a temporary projects directory."""
+    return ReconstructService(tmp_path)
+
+
+class TestRunAllStages:
+    """Tests for run_all_stages."""
+
+    @pytest.mark.parametrize(
+        "emit_intermediate",
+        [
+            pytest.param(False, id="direct"),
+            pytest.param(True, id="intermediate"),
+        ],
+    )
+    def test_completes_session(
+        self, service: ReconstructService, emit_intermediate: bool
+    ) -> None:
+        """Both paths should end in the same completed session."""
+        session = service.start_session("obj", input_frames=40)
+
+        result = service.run_all_stages(session, emit_intermediate=emit_intermediate)
+
+        assert result.current_stage == ReconstructStage.COMPLETE
+        assert not result.is_running
+        assert result.metrics.num_vertices > 0
+        assert result.output_mesh_path == str(
+            service.projects_dir / "obj" / "recon" / "mesh.ply"
+        )
+
+    def test_emits_every_stage_in_order(self, service: ReconstructService) -> None:
+        """on_stage should see each stage after IDLE exactly once."""
+        emitted: list[ReconstructSession] = []
+
+        service.run_all_stages(
+            service.start_session("obj", input_frames=40),
+            emit_intermediate=True,
+            on_stage=emitted.append,
+        )
+
+        assert [s.current_stage for s in emitted] == STAGE_ORDER[1:]
+
+    def test_direct_run_skips_on_stage(self, service: ReconstructService) -> None:
+        """on_stage should not be called unless emit_intermediate is set."""
+        emitted: list[ReconstructSession] = []
+
+        service.run_all_stages(
+            service.start_session("obj", input_frames=40), on_stage=emitted.append
+        )
+
+        assert not emitted
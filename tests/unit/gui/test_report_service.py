@@ -0,0 +1,95 @@
+"""Tests for scan2mesh_gui.services.report_service module."""
+
+import pytest
+
+from scan2mesh_gui.models.config import QualityThresholds
+from scan2mesh_gui.models.report_session import ActionPriority, QualityGateResult
+from scan2mesh_gui.models.scan_object import QualityStatus
+from scan2mesh_gui.services.report_service import ReportService, _eval_threshold
+
+
+def _gate(name: str, status: QualityStatus) -> QualityGateResult:
+    """Create a gate result with placeholder value, threshold and reason."""
+    return QualityGateResult(
+        gate_name=name, status=status, value=0, threshold="-", reason="-"
+    )
+
+
+@pytest.fixture(scope="module")
+def service() -> ReportService:
+    """Create a ReportService with default thresholds."""
+    return ReportService(QualityThresholds())
+
+
+class TestGateSummary:
+    """Tests for recommendations and overall status derived from gates."""
+
+    @pytest.mark.parametrize(
+        ("statuses", "expected_status"),
+        [
+            pytest.param([], QualityStatus.PENDING, id="no_gates"),
+            pytest.param([QualityStatus.PASS], QualityStatus.PASS, id="pass"),
+            pytest.param(
+                [QualityStatus.PASS, QualityStatus.WARN], QualityStatus.WARN, id="warn"
+            ),
+            pytest.param(
+                [QualityStatus.WARN, QualityStatus.FAIL], QualityStatus.FAIL, id="fail"
+            ),
+        ],
+    )
+    def test_calculate_overall_status(
+        self,
+        service: ReportService,
+        statuses: list[QualityStatus],
+        expected_status: QualityStatus,
+    ) -> None:
+        """The most severe gate status should decide the overall status."""
+        gates = [_gate("Minimum Keyframes", status) for status in statuses]
+
+        status, message = service.calculate_overall_status(gates)
+
+        assert status is expected_status
+        assert message
+
+    def test_generate_recommendations(self, service: ReportService) -> None:
+        """Failed and warned gates should each yield one action, in order."""
+        gates = [
+            _gate("Minimum Keyframes", QualityStatus.FAIL),
+            _gate("Depth Valid Ratio", QualityStatus.PASS),
+            _gate("Depth Valid Ratio", QualityStatus.WARN),
+            _gate("Unknown Gate", QualityStatus.FAIL),
+        ]
+
+        actions = service.generate_recommendations(gates)
+
+        assert [action.priority for action in actions] == [
+            ActionPriority.HIGH,
+            ActionPriority.LOW,
+        ]
+
+    def test_wrappers_match_summary(self, service: ReportService) -> None:
+        """Both public methods should agree with the shared gate summary."""
+        gates = [
+            _gate("Minimum Keyframes", QualityStatus.WARN),
+            _gate("Depth Valid Ratio", QualityStatus.FAIL),
+        ]
+
+        recommendations, status, message = service._summarize_gates(gates)
+
+        assert service.generate_recommendations(gates) == recommendations
+        assert service.calculate_overall_status(gates) == (status, message)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param(0.1, QualityStatus.FAIL, id="below_fail"),
+        pytest.param(0.5, QualityStatus.WARN, id="at_fail"),
+        pytest.param(0.7, QualityStatus.WARN, id="below_warn"),
+        pytest.param(0.8, QualityStatus.PASS, id="at_warn"),
+        pytest.param(float("nan"), QualityStatus.PASS, id="nan"),
+    ],
+)
+def test_eval_threshold(value: float, expected: QualityStatus) -> None:
+    """Values below fail are FAIL, below warn are WARN, anything else PASS."""
+    assert _eval_threshold(value, 0.8, 0.5) is expected
@@ -1,6 +1,7 @@
 """Tests for scan2mesh.models.config module."""
 
 from datetime import datetime
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
@@ -13,6 +14,15 @@ from scan2mesh.models.config import (
 )
 
 
+# Fixed timestamp keeps the configs deterministic
+_NOW = datetime(2024, 1, 1)
+_BASE_KWARGS: dict[str, Any] = {
+    "config_hash": "x",
+    "created_at": _NOW,
+    "updated_at": _NOW,
+}
+
+
 class TestCoordinateSystem:
     """Tests for CoordinateSystem model."""
 
@@ -95,13 +105,12 @@ class TestProjectConfig:
 
     def test_valid_config(self) -> None:
         """Test valid project configuration."""
-        now = datetime.now()
         config = ProjectConfig(
             object_name="test_ball",
             class_id=42,
             config_hash="abc123",
-            created_at=now,
-            updated_at=now,
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         assert config.object_name == "test_ball"
         assert config.class_id == 42
@@ -109,120 +118,49 @@ class TestProjectConfig:
 
     def test_object_name_validation(self) -> None:
         """Test object name validation."""
-        now = datetime.now()
         # Valid names
-        ProjectConfig(
-            object_name="test_ball",
-            class_id=0,
-            config_hash="x",
-            created_at=now,
-            updated_at=now,
-        )
-        ProjectConfig(
-            object_name="my-object",
-            class_id=0,
-            config_hash="x",
-            created_at=now,
-            updated_at=now,
-        )
-        ProjectConfig(
-            object_name="Object123",
-            class_id=0,
-            config_hash="x",
-            created_at=now,
-            updated_at=now,
-        )
+        ProjectConfig(object_name="test_ball", class_id=0, **_BASE_KWARGS)
+        ProjectConfig(object_name="my-object", class_id=0, **_BASE_KWARGS)
+        ProjectConfig(object_name="Object123", class_id=0, **_BASE_KWARGS)
 
         # Invalid names - empty
         with pytest.raises(ValidationError):
-            ProjectConfig(
-                object_name="",
-                class_id=0,
-                config_hash="x",
-                created_at=now,
-                updated_at=now,
-            )
+            ProjectConfig(object_name="", class_id=0, **_BASE_KWARGS)
 
         # Invalid names - space (doesn't match pattern)
         with pytest.raises(ValidationError):
-            ProjectConfig(
-                object_name="test ball",
-                class_id=0,
-                config_hash="x",
-                created_at=now,
-                updated_at=now,
-            )
+            ProjectConfig(object_name="test ball", class_id=0, **_BASE_KWARGS)
 
         # Invalid names - slash (doesn't match pattern)
         with pytest.raises(ValidationError):
-            ProjectConfig(
-                object_name="test/ball",
-                class_id=0,
-                config_hash="x",
-                created_at=now,
-                updated_at=now,
-            )
+            ProjectConfig(object_name="test/ball", class_id=0, **_BASE_KWARGS)
 
     def test_path_traversal_prevention(self) -> None:
         """Test path traversal attempt detection."""
-        now = datetime.now()
         # These should fail the pattern validation, not just path traversal
         with pytest.raises(ValidationError):
-            ProjectConfig(
-                object_name="../etc",
-                class_id=0,
-                config_hash="x",
-                created_at=now,
-                updated_at=now,
-            )
+            ProjectConfig(object_name="../etc", class_id=0, **_BASE_KWARGS)
 
     def test_class_id_range(self) -> None:
         """Test class ID range validation."""
-        now = datetime.now()
         # Valid IDs
-        ProjectConfig(
-            object_name="test",
-            class_id=0,
-            config_hash="x",
-            created_at=now,
-            updated_at=now,
-        )
-        ProjectConfig(
-            object_name="test",
-            class_id=9999,
-            config_hash="x",
-            created_at=now,
-            updated_at=now,
-        )
+        ProjectConfig(object_name="test", class_id=0, **_BASE_KWARGS)
+        ProjectConfig(object_name="test", class_id=9999, **_BASE_KWARGS)
 
         # Invalid IDs
         with pytest.raises(ValidationError):
-            ProjectConfig(
-                object_name="test",
-                class_id=-1,
-                config_hash="x",
-                created_at=now,
-                updated_at=now,
-            )
+            ProjectConfig(object_name="test", class_id=-1, **_BASE_KWARGS)
 
         with pytest.raises(ValidationError):
-            ProjectConfig(
-                object_name="test",
-                class_id=10000,
-                config_hash="x",
-                created_at=now,
-                updated_at=now,
-            )
+            ProjectConfig(object_name="test", class_id=10000, **_BASE_KWARGS)
 
     def test_immutability(self) -> None:
         """Test that config is immutable (frozen)."""
-        now = datetime.now()
-        config = ProjectConfig(
+        # Validation is not under test here; frozen is enforced on assignment
+        config = ProjectConfig.model_construct(
             object_name="test",
             class_id=0,
-            config_hash="x",
-            created_at=now,
-            updated_at=now,
+            **_BASE_KWARGS,
         )
         with pytest.raises(ValidationError):
             config.object_name = "modified"  # type: ignore[misc]
@@ -1,11 +1,29 @@
 """Tests for preprocess models."""
 
+from typing import Any
+
 import pytest
 from pydantic import ValidationError
 
 from scan2mesh.models import MaskedFrame, MaskMethod, PreprocessMetrics
 
 
+# Minimal valid MaskedFrame fields; tests override only what they exercise
+_BASE_MASKED_FRAME: dict[str, Any] = {
+    "frame_id": 0,
+    "rgb_masked_path": "test.png",
+    "depth_masked_path": "test.npy",
+    "mask_path": "mask.png",
+    "mask_method": MaskMethod.DEPTH_THRESHOLD,
+    "mask_area_ratio": 0.5,
+}
+
+
+def _masked_frame(**overrides: Any) -> MaskedFrame:
+    """Create a fully validated MaskedFrame from the base fields."""
+    return MaskedFrame(**{**_BASE_MASKED_FRAME, **overrides})
+
+
 class TestMaskMethod:
     """Tests for MaskMethod enum."""
 
@@ -21,12 +39,10 @@ class TestMaskedFrame:
 
     def test_masked_frame_creation(self) -> None:
         """Test MaskedFrame creation."""
-        frame = MaskedFrame(
-            frame_id=0,
+        frame = _masked_frame(
             rgb_masked_path="masked_frames/frame_0000_rgb_masked.png",
             depth_masked_path="masked_frames/frame_0000_depth_masked.npy",
             mask_path="masked_frames/frame_0000_mask.png",
-            mask_method=MaskMethod.DEPTH_THRESHOLD,
             mask_area_ratio=0.4,
             is_valid=True,
         )
@@ -38,14 +54,7 @@ class TestMaskedFrame:
 
     def test_masked_frame_immutable(self) -> None:
         """Test MaskedFrame is immutable."""
-        frame = MaskedFrame(
-            frame_id=0,
-            rgb_masked_path="test.png",
-            depth_masked_path="test.npy",
-            mask_path="mask.png",
-            mask_method=MaskMethod.DEPTH_THRESHOLD,
-            mask_area_ratio=0.5,
-        )
+        frame = _masked_frame()
 
         with pytest.raises(ValidationError):
             frame.frame_id = 1  # type: ignore[misc]
@@ -53,26 +62,12 @@ class TestMaskedFrame:
     def test_masked_frame_invalid_frame_id(self) -> None:
         """Test MaskedFrame rejects negative frame_id."""
         with pytest.raises(ValidationError):
-            MaskedFrame(
-                frame_id=-1,
-                rgb_masked_path="test.png",
-                depth_masked_path="test.npy",
-                mask_path="mask.png",
-                mask_method=MaskMethod.DEPTH_THRESHOLD,
-                mask_area_ratio=0.5,
-            )
+            _masked_frame(frame_id=-1)
 
     def test_masked_frame_invalid_mask_area_ratio(self) -> None:
         """Test MaskedFrame rejects invalid mask_area_ratio."""
         with pytest.raises(ValidationError):
-            MaskedFrame(
-                frame_id=0,
-                rgb_masked_path="test.png",
-                depth_masked_path="test.npy",
-                mask_path="mask.png",
-                mask_method=MaskMethod.DEPTH_THRESHOLD,
-                mask_area_ratio=1.5,  # Above 1.0
-            )
+            _masked_frame(mask_area_ratio=1.5)  # Above 1.0
 
 
 class TestPreprocessMetrics:
@@ -1,5 +1,8 @@
 """Tests for CameraService."""
 
+import sys
+from collections.abc import Generator
+
 import numpy as np
 import pytest
 
@@ -8,26 +11,48 @@ from scan2mesh.models import CameraIntrinsics, RawFrame
 from scan2mesh.services.camera import MockCameraService, create_camera_service
 
 
+@pytest.fixture(scope="module")
+def camera() -> MockCameraService:
+    """Create one MockCameraService with fixed seed for the module.
+
+    Tests using it must leave it stopped; lifecycle tests that start
+    streaming create their own camera instead.
+    """
+    return MockCameraService(seed=42)
+
+
+@pytest.fixture(scope="module")
+def sample_frame() -> Generator[RawFrame, None, None]:
+    """Capture one frame from a seeded MockCameraService.
+
+    Module-scoped so the read-only frame tests share a single synthetic
+    frame instead of generating one each.
+    """
+    camera = MockCameraService(seed=42)
+    camera.start_streaming()
+    try:
+        yield camera.capture_frame()
+    finally:
+        camera.stop_streaming()
+
+
 class TestMockCameraService:
     """Tests for MockCameraService class."""
 
-    @pytest.fixture
-    def camera(self) -> MockCameraService:
-        """Create MockCameraService instance with fixed seed."""
-        return MockCameraService(seed=42)
-
     def test_initial_state(self, camera: MockCameraService) -> None:
         """Camera should not be streaming initially."""
         assert camera.is_streaming is False
 
-    def test_start_streaming(self, camera: MockCameraService) -> None:
+    def test_start_streaming(self) -> None:
         """Camera should be streaming after start_streaming()."""
+        camera = MockCameraService(seed=42)
         camera.start_streaming()
         assert camera.is_streaming is True
         camera.stop_streaming()
 
-    def test_stop_streaming(self, camera: MockCameraService) -> None:
+    def test_stop_streaming(self) -> None:
         """Camera should not be streaming after stop_streaming()."""
+        camera = MockCameraService(seed=42)
         camera.start_streaming()
         camera.stop_streaming()
         assert camera.is_streaming is False
@@ -39,77 +64,54 @@ class TestMockCameraService:
         with pytest.raises(CameraError, match="not streaming"):
             camera.capture_frame()
 
-    def test_capture_frame_returns_raw_frame(
-        self, camera: MockCameraService
-    ) -> None:
+    def test_capture_frame_returns_raw_frame(self, sample_frame: RawFrame) -> None:
         """Capture should return RawFrame with correct types."""
-        camera.start_streaming()
-        try:
-            frame = camera.capture_frame()
+        frame = sample_frame
 
-            assert isinstance(frame, RawFrame)
-            assert isinstance(frame.rgb, np.ndarray)
-            assert isinstance(frame.depth, np.ndarray)
-            assert frame.rgb.dtype == np.uint8
-            assert frame.depth.dtype == np.uint16
-            assert frame.timestamp is not None
-            assert isinstance(frame.intrinsics, CameraIntrinsics)
-        finally:
-            camera.stop_streaming()
+        assert isinstance(frame, RawFrame)
+        assert isinstance(frame.rgb, np.ndarray)
+        assert isinstance(frame.depth, np.ndarray)
+        assert frame.rgb.dtype == np.uint8
+        assert frame.depth.dtype == np.uint16
+        assert frame.timestamp is not None
+        assert isinstance(frame.intrinsics, CameraIntrinsics)
 
-    def test_capture_frame_rgb_shape(self, camera: MockCameraService) -> None:
+    def test_capture_frame_rgb_shape(self, sample_frame: RawFrame) -> None:
         """RGB image should have correct shape (H, W, 3)."""
-        camera.start_streaming()
-        try:
-            frame = camera.capture_frame()
+        frame = sample_frame
 
-            assert frame.rgb.shape == (
-                MockCameraService.DEFAULT_RGB_HEIGHT,
-                MockCameraService.DEFAULT_RGB_WIDTH,
-                3,
-            )
-        finally:
-            camera.stop_streaming()
+        assert frame.rgb.shape == (
+            MockCameraService.DEFAULT_RGB_HEIGHT,
+            MockCameraService.DEFAULT_RGB_WIDTH,
+            3,
+        )
 
-    def test_capture_frame_depth_shape(self, camera: MockCameraService) -> None:
+    def test_capture_frame_depth_shape(self, sample_frame: RawFrame) -> None:
         """Depth image should have correct shape (H, W)."""
-        camera.start_streaming()
-        try:
-            frame = camera.capture_frame()
+        frame = sample_frame
 
-            assert frame.depth.shape == (
-                MockCameraService.DEFAULT_DEPTH_HEIGHT,
-                MockCameraService.DEFAULT_DEPTH_WIDTH,
-            )
-        finally:
-            camera.stop_streaming()
+        assert frame.depth.shape == (
+            MockCameraService.DEFAULT_DEPTH_HEIGHT,
+            MockCameraService.DEFAULT_DEPTH_WIDTH,
+        )
 
-    def test_capture_frame_has_object(self, camera: MockCameraService) -> None:
+    def test_capture_frame_has_object(self, sample_frame: RawFrame) -> None:
         """Generated frames should have object-like depth values."""
-        camera.start_streaming()
-        try:
-            frame = camera.capture_frame()
+        frame = sample_frame
 
-            # Center should have depth values in object range (400-600mm)
-            center_y = frame.depth.shape[0] // 2
-            center_x = frame.depth.shape[1] // 2
-            center_depth = frame.depth[center_y, center_x]
+        # Center should have depth values in object range (400-600mm)
+        center_y = frame.depth.shape[0] // 2
+        center_x = frame.depth.shape[1] // 2
+        center_depth = frame.depth[center_y, center_x]
 
-            assert 300 < center_depth < 700, f"Center depth {center_depth} not in expected range"
-        finally:
-            camera.stop_streaming()
+        assert 300 < center_depth < 700, f"Center depth {center_depth} not in expected range"
 
-    def test_capture_frame_has_holes(self, camera: MockCameraService) -> None:
+    def test_capture_frame_has_holes(self, sample_frame: RawFrame) -> None:
         """Generated depth should have some invalid (zero) pixels."""
-        camera.start_streaming()
-        try:
-            frame = camera.capture_frame()
+        frame = sample_frame
 
-            # Should have some zero pixels (holes)
-            zero_count = np.count_nonzero(frame.depth == 0)
-            assert zero_count > 0, "Depth should have some invalid pixels"
-        finally:
-            camera.stop_streaming()
+        # Should have some zero pixels (holes)
+        assert not frame.depth.all(), "Depth should have some invalid pixels"
 
     def test_get_intrinsics(self, camera: MockCameraService) -> None:
         """Intrinsics should have correct values."""
@@ -185,27 +187,28 @@ class TestCreateCameraService:
         """Factory should pass kwargs to MockCameraService."""
         service = create_camera_service(
             use_mock=True,
-            rgb_width=640,
-            rgb_height=480,
+            depth_width=320,
+            depth_height=240,
+            depth_scale=0.0005,
             seed=42,
         )
         assert isinstance(service, MockCameraService)
 
-        # Verify the kwargs were applied
-        service.start_streaming()
-        try:
-            frame = service.capture_frame()
-            assert frame.rgb.shape == (480, 640, 3)
-        finally:
-            service.stop_streaming()
+        # Verify the kwargs were applied through the intrinsics, which
+        # describe the depth stream; test_custom_resolution covers the
+        # resulting frame shapes, so no frame needs to be generated here
+        intrinsics = service.get_intrinsics()
+        assert intrinsics.width == 320
+        assert intrinsics.height == 240
+        assert service.get_depth_scale() == 0.0005
 
-    def test_create_realsense_without_hardware_raises(self) -> None:
+    def test_create_realsense_without_hardware_raises(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Factory should raise CameraError when RealSense not available."""
-        import contextlib
+        # A None entry makes the import fail without loading the vendor SDK,
+        # so the result does not depend on what is installed
+        monkeypatch.setitem(sys.modules, "pyrealsense2", None)
 
-        # This test will fail if pyrealsense2 is installed but no camera connected
-        # In most test environments, this should raise an error
-        with contextlib.suppress(CameraError):
+        with pytest.raises(CameraError, match="pyrealsense2 is not installed"):
             create_camera_service(use_mock=False)
-            # If we get here, pyrealsense2 might be available
-            # That's OK, we can't force it to fail
@@ -2,18 +2,36 @@
 
 import numpy as np
 import pytest
+from numpy.typing import NDArray
 
 from scan2mesh.services.image import ImageService
 
 
+def _read_only(array: NDArray[np.uint16]) -> NDArray[np.uint16]:
+    """Mark a shared input array read-only so no test can mutate it."""
+    array.setflags(write=False)
+    return array
+
+
+# Depth inputs shared by the parametrized tests
+_DEPTH_500MM = _read_only(np.full((100, 100), 500, dtype=np.uint16))
+_DEPTH_2000MM = _read_only(np.full((100, 100), 2000, dtype=np.uint16))
+_DEPTH_ZERO = _read_only(np.zeros((100, 100), dtype=np.uint16))
+_DEPTH_HALF_VALID = _read_only(
+    np.concatenate([np.full((50, 100), 500), np.zeros((50, 100))]).astype(np.uint16)
+)
+_DEPTH_EMPTY = _read_only(np.zeros((0, 0), dtype=np.uint16))
+
+
+@pytest.fixture(scope="module")
+def service() -> ImageService:
+    """Create one stateless ImageService shared by the module."""
+    return ImageService()
+
+
 class TestImageService:
     """Tests for ImageService class."""
 
-    @pytest.fixture
-    def service(self) -> ImageService:
-        """Create ImageService instance."""
-        return ImageService()
-
     # ============================================================
     # calculate_blur_score tests
     # ============================================================
@@ -21,11 +39,10 @@ class TestImageService:
     def test_calculate_blur_score_sharp_image(self, service: ImageService) -> None:
         """Sharp image with high frequency edges should have high score."""
         # Create image with sharp edges (checkerboard pattern)
-        rgb = np.zeros((100, 100, 3), dtype=np.uint8)
-        for i in range(100):
-            for j in range(100):
-                if (i // 10 + j // 10) % 2 == 0:
-                    rgb[i, j] = [255, 255, 255]
+        rows, cols = np.indices((100, 100))
+        white = (rows // 10 + cols // 10) % 2 == 0
+        rgb = np.where(white[..., None], 255, 0).astype(np.uint8)
+        rgb = np.broadcast_to(rgb, (100, 100, 3)).copy()
 
         score = service.calculate_blur_score(rgb)
 
@@ -47,9 +64,8 @@ class TestImageService:
     def test_calculate_blur_score_gradient_image(self, service: ImageService) -> None:
         """Image with gradual gradient should have moderate score."""
         # Create horizontal gradient
-        rgb = np.zeros((100, 100, 3), dtype=np.uint8)
-        for i in range(100):
-            rgb[:, i] = [int(i * 2.55)] * 3
+        column = (np.arange(100) * 2.55).astype(np.uint8)
+        rgb = np.broadcast_to(column[None, :, None], (100, 100, 3)).copy()
 
         score = service.calculate_blur_score(rgb)
 
@@ -77,75 +93,57 @@ class TestImageService:
     # calculate_depth_valid_ratio tests
     # ============================================================
 
-    def test_calculate_depth_valid_ratio_all_valid(
-        self, service: ImageService
+    @pytest.mark.parametrize(
+        ("depth", "expected"),
+        [
+            pytest.param(_DEPTH_500MM, 1.0, id="all_valid"),
+            pytest.param(_DEPTH_ZERO, 0.0, id="all_invalid"),
+            pytest.param(_DEPTH_HALF_VALID, 0.5, id="half_valid"),
+        ],
+    )
+    def test_calculate_depth_valid_ratio(
+        self, service: ImageService, depth: NDArray[np.uint16], expected: float
     ) -> None:
-        """All non-zero pixels should give ratio of 1.0."""
-        depth = np.full((100, 100), 500, dtype=np.uint16)
-
-        ratio = service.calculate_depth_valid_ratio(depth)
-
-        assert ratio == 1.0
-
-    def test_calculate_depth_valid_ratio_all_invalid(
-        self, service: ImageService
-    ) -> None:
-        """All zero pixels should give ratio of 0.0."""
-        depth = np.zeros((100, 100), dtype=np.uint16)
-
-        ratio = service.calculate_depth_valid_ratio(depth)
-
-        assert ratio == 0.0
-
-    def test_calculate_depth_valid_ratio_half_valid(
-        self, service: ImageService
-    ) -> None:
-        """Half valid pixels should give ratio of 0.5."""
-        depth = np.zeros((100, 100), dtype=np.uint16)
-        depth[:50, :] = 500
-
+        """Ratio should be the fraction of non-zero pixels."""
         ratio = service.calculate_depth_valid_ratio(depth)
 
-        assert ratio == 0.5
+        assert ratio == expected
 
     def test_calculate_depth_valid_ratio_empty_raises(
         self, service: ImageService
     ) -> None:
         """Empty depth image should raise ValueError."""
-        depth = np.array([], dtype=np.uint16).reshape(0, 0)
-
         with pytest.raises(ValueError, match="Depth image is empty"):
-            service.calculate_depth_valid_ratio(depth)
+            service.calculate_depth_valid_ratio(_DEPTH_EMPTY)
 
     # ============================================================
     # estimate_object_occupancy tests
     # ============================================================
 
-    def test_estimate_object_occupancy_all_in_range(
-        self, service: ImageService
-    ) -> None:
-        """All pixels in range should give occupancy of 1.0."""
-        depth = np.full((100, 100), 500, dtype=np.uint16)  # 500mm, within default range
-
-        occupancy = service.estimate_object_occupancy(depth)
-
-        assert occupancy == 1.0
-
-    def test_estimate_object_occupancy_none_in_range(
-        self, service: ImageService
+    @pytest.mark.parametrize(
+        ("depth", "expected"),
+        [
+            # 500mm, within default range
+            pytest.param(_DEPTH_500MM, 1.0, id="all_in_range"),
+            # 2000mm, outside default range
+            pytest.param(_DEPTH_2000MM, 0.0, id="none_in_range"),
+            # Zero depth (invalid) should not count as in range
+            pytest.param(_DEPTH_ZERO, 0.0, id="zero_depth"),
+        ],
+    )
+    def test_estimate_object_occupancy(
+        self, service: ImageService, depth: NDArray[np.uint16], expected: float
     ) -> None:
-        """No pixels in range should give occupancy of 0.0."""
-        depth = np.full((100, 100), 2000, dtype=np.uint16)  # 2000mm, outside default range
-
+        """Occupancy should be the fraction of pixels in the default range."""
         occupancy = service.estimate_object_occupancy(depth)
 
-        assert occupancy == 0.0
+        assert occupancy == expected
 
     def test_estimate_object_occupancy_custom_range(
         self, service: ImageService
     ) -> None:
         """Custom depth range should work correctly."""
-        depth = np.full((100, 100), 500, dtype=np.uint16)
+        depth = _DEPTH_500MM
 
         # 500mm is within 300-600 range
         occupancy_in = service.estimate_object_occupancy(
@@ -159,24 +157,12 @@ class TestImageService:
         )
         assert occupancy_out == 0.0
 
-    def test_estimate_object_occupancy_zero_depth(
-        self, service: ImageService
-    ) -> None:
-        """Zero depth (invalid) should not count as in range."""
-        depth = np.zeros((100, 100), dtype=np.uint16)
-
-        occupancy = service.estimate_object_occupancy(depth)
-
-        assert occupancy == 0.0
-
     def test_estimate_object_occupancy_empty_raises(
         self, service: ImageService
     ) -> None:
         """Empty depth image should raise ValueError."""
-        depth = np.array([], dtype=np.uint16).reshape(0, 0)
-
         with pytest.raises(ValueError, match="Depth image is empty"):
-            service.estimate_object_occupancy(depth)
+            service.estimate_object_occupancy(_DEPTH_EMPTY)
 
     # ============================================================
     # calculate_depth_statistics tests
@@ -197,9 +183,7 @@ class TestImageService:
 
     def test_calculate_depth_statistics_empty(self, service: ImageService) -> None:
         """Empty depth image should return zeros."""
-        depth = np.array([], dtype=np.uint16).reshape(0, 0)
-
-        stats = service.calculate_depth_statistics(depth)
+        stats = service.calculate_depth_statistics(_DEPTH_EMPTY)
 
         assert stats["valid_ratio"] == 0.0
         assert stats["mean_depth_mm"] == 0.0
@@ -207,9 +191,7 @@ class TestImageService:
 
     def test_calculate_depth_statistics_all_zero(self, service: ImageService) -> None:
         """All zero depth should return zero statistics."""
-        depth = np.zeros((10, 10), dtype=np.uint16)
-
-        stats = service.calculate_depth_statistics(depth)
+        stats = service.calculate_depth_statistics(_DEPTH_ZERO)
 
         assert stats["valid_ratio"] == 0.0
         assert stats["mean_depth_mm"] == 0.0